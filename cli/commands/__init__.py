@@ -0,0 +1,3 @@
+"""
+Subcommands for the YouTube Video Downloader CLI, loaded on demand by the main group.
+"""
@@ -0,0 +1,287 @@
+"""
+Helpers shared by the subcommands of the YouTube Video Downloader CLI.
+"""
+
+import click
+import sys
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Iterator, Tuple
+
+from cli.interfaces import (
+    YOUTUBE_URL_RE,
+    YOUTUBE_PLAYLIST_RE,
+    QUALITY_CHOICES,
+    VIDEO_FORMAT_CHOICES,
+    AUDIO_FORMAT_CHOICES,
+    VIDEO_CODEC_CHOICES,
+    AUDIO_CODEC_CHOICES,
+    SUBTITLE_FORMAT_CHOICES,
+)
+from cli.main_cli import get_cli_app
+
+if TYPE_CHECKING:
+    from core.application import YouTubeDownloaderApp
+    from models.core import DownloadConfig, ProgressInfo
+
+# Batch files larger than this are rejected before reading
+_MAX_BATCH_FILE_SIZE = 100 * 1024 * 1024
+
+# Whole batch-file lines, multiline mode. The first captures the stripped
+# text of lines YOUTUBE_URL_RE accepts; the second marks every line that is
+# neither blank nor a comment. The URL path is greedy and ends on a
+# non-space, so whitespace runs inside a line cannot cause backtracking.
+_BATCH_URL_LINE_RE = re.compile(
+    r'^[^\S\n]*((?:https?://)?(?:[\w-]+\.)*(?:youtube\.com|youtu\.be)(?:/(?:[^\n]*\S)?)?)[^\S\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+_BATCH_ENTRY_LINE_RE = re.compile(r'^[^\S\n]*[^#\s]', re.MULTILINE)
+
+
+class FastChoice(click.Choice):
+    """click.Choice that accepts exact matches with a single set lookup."""
+    
+    def __init__(self, choices, case_sensitive: bool = True):
+        """Initialize the choice type and its lookup set."""
+        super().__init__(choices, case_sensitive)
+        self._choice_set = frozenset(choices)
+    
+    def convert(self, value: Any, param: Optional[click.Parameter],
+                ctx: Optional[click.Context]) -> Any:
+        """Return exact matches directly; defer everything else to click.Choice."""
+        if isinstance(value, str) and value in self._choice_set:
+            return value
+        return super().convert(value, param, ctx)
+
+
+# Choice types shared by the subcommands that expose the same option
+QUALITY_CHOICE = FastChoice(QUALITY_CHOICES)
+VIDEO_FORMAT_CHOICE = FastChoice(VIDEO_FORMAT_CHOICES)
+AUDIO_FORMAT_CHOICE = FastChoice(AUDIO_FORMAT_CHOICES)
+VIDEO_CODEC_CHOICE = FastChoice(VIDEO_CODEC_CHOICES)
+AUDIO_CODEC_CHOICE = FastChoice(AUDIO_CODEC_CHOICES)
+SUBTITLE_FORMAT_CHOICE = FastChoice(SUBTITLE_FORMAT_CHOICES)
+
+
+def is_valid_youtube_url(url: str) -> bool:
+    """
+    Validate if URL is a valid YouTube video URL.
+    
+    Args:
+        url: URL to validate
+        
+    Returns:
+        True if valid YouTube URL, False otherwise
+    """
+    if not isinstance(url, str):
+        return False
+    return YOUTUBE_URL_RE.match(url) is not None
+
+
+def is_valid_youtube_playlist_url(url: str) -> bool:
+    """
+    Validate if URL is a valid YouTube playlist URL.
+    
+    Args:
+        url: URL to validate
+        
+    Returns:
+        True if valid YouTube playlist URL, False otherwise
+    """
+    if not isinstance(url, str):
+        return False
+    return YOUTUBE_PLAYLIST_RE.match(url) is not None
+
+
+def _process_cli_args(cli_args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Process CLI arguments to handle Path objects and other conversions.
+    
+    Args:
+        cli_args: Raw CLI arguments
+        
+    Returns:
+        Processed CLI arguments
+    """
+    # Drop unset options and convert Path objects to strings in one pass
+    processed_args = {
+        ('output_directory' if key == 'output' else key): (str(value) if isinstance(value, Path) else value)
+        for key, value in cli_args.items()
+        if value is not None
+    }
+    
+    # Process subtitle languages if provided
+    subtitle_languages = processed_args.get('subtitle_languages')
+    if subtitle_languages:
+        processed_args['subtitle_languages'] = [lang.strip() for lang in subtitle_languages.split(',')]
+    
+    return processed_args
+
+
+def _apply_overrides(base_config: 'DownloadConfig', cli_args: Dict[str, Any]) -> 'DownloadConfig':
+    """
+    Apply CLI option overrides on top of a base configuration.
+    
+    Args:
+        base_config: Configuration loaded from file or defaults
+        cli_args: Raw CLI arguments (unset options are None)
+        
+    Returns:
+        Merged configuration, or base_config unchanged if no options were set
+    """
+    overrides = _process_cli_args(cli_args)
+    if not overrides:
+        return base_config
+    return get_cli_app().config_manager.merge_cli_args(base_config, overrides)
+
+
+def iter_batch_file(file_path: Path) -> Iterator[str]:
+    """
+    Yield valid URLs from a batch file.
+    
+    Empty lines, comments and repeated URLs are skipped. Invalid lines are
+    reported on stderr once the whole file has been scanned.
+    
+    Args:
+        file_path: Path to batch file
+        
+    Yields:
+        Valid URLs, in file order
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    
+    # Extract valid URL lines with one regex sweep; the per-line loop below
+    # is only needed when there are invalid lines to report
+    urls = _BATCH_URL_LINE_RE.findall(text)
+    if len(urls) == len(_BATCH_ENTRY_LINE_RE.findall(text)):
+        yield from dict.fromkeys(urls)
+        return
+    
+    warnings = []
+    seen = set()
+    match_youtube_url = YOUTUBE_URL_RE.match
+    for line_num, line in enumerate(text.split('\n'), 1):
+        line = line.strip()
+        # Skip empty lines, comments and URLs already seen
+        if not line or line[0] == '#' or line in seen:
+            continue
+        seen.add(line)
+        if match_youtube_url(line):
+            yield line
+        else:
+            warnings.append(f"Warning: Invalid URL on line {line_num}: {line}")
+    
+    # Report all invalid lines with a single write
+    if warnings:
+        sys.stderr.write('\n'.join(warnings) + '\n')
+
+
+def bootstrap_app(
+    ctx: click.Context,
+    cli_args: Dict[str, Any],
+    progress_callback: Callable[['ProgressInfo'], None]
+) -> Tuple['YouTubeDownloaderApp', 'DownloadConfig']:
+    """
+    Create the application controller and effective configuration for a command.
+    
+    Args:
+        ctx: Click context holding the base configuration
+        cli_args: Raw CLI arguments of the command
+        progress_callback: Callback installed for download progress updates
+        
+    Returns:
+        Tuple of (application controller, merged configuration)
+    """
+    from core.application import YouTubeDownloaderApp
+    
+    final_config = _apply_overrides(ctx.obj['config'], cli_args)
+    
+    app = YouTubeDownloaderApp()
+    app.set_progress_callback(progress_callback)
+    
+    return app, final_config
+
+
+def format_workflow_summary(title: str, summary: Dict[str, Any]) -> str:
+    """
+    Format a playlist or batch results summary as one block of text.
+    
+    Args:
+        title: Heading line for the summary
+        summary: Summary dictionary from YouTubeDownloaderApp.get_workflow_summary
+        
+    Returns:
+        Multi-line summary text
+    """
+    lines = [
+        f"\n{title}",
+        f"Total downloads: {summary['total_downloads']}",
+        f"Successful: {summary['successful_downloads']}",
+        f"Failed: {summary['failed_downloads']}"
+    ]
+    
+    if summary['videos_with_splits'] > 0:
+        lines.append(f"Videos split into chapters: {summary['videos_with_splits']}")
+        lines.append(f"Total split files created: {summary['total_split_files']}")
+    
+    if summary['successful_downloads'] > 0:
+        lines.append(f"Total download time: {summary['total_download_time']:.1f} seconds")
+        lines.append(f"Average time per download: {summary['average_download_time']:.1f} seconds")
+    
+    return '\n'.join(lines)
+
+
+def count_batch_urls(file_path: Path) -> int:
+    """
+    Count the valid URLs in a batch file without keeping them in memory.
+    
+    The download itself re-reads the file, so only the count is needed here.
+    
+    Args:
+        file_path: Path to batch file
+        
+    Returns:
+        Number of distinct valid URLs
+        
+    Raises:
+        ConfigurationError: If the file cannot be read or exceeds the size limit
+    """
+    from config.error_handling import ConfigurationError
+    
+    try:
+        file_size = os.path.getsize(file_path)
+    except OSError as e:
+        raise ConfigurationError(f"Failed to read batch file {file_path}: {str(e)}")
+    
+    if file_size > _MAX_BATCH_FILE_SIZE:
+        raise ConfigurationError(
+            f"Batch file {file_path} is too large "
+            f"({file_size} bytes, limit {_MAX_BATCH_FILE_SIZE} bytes)"
+        )
+    
+    try:
+        return sum(1 for _ in iter_batch_file(file_path))
+    except Exception as e:
+        raise ConfigurationError(f"Failed to read batch file {file_path}: {str(e)}")
+
+
+@contextmanager
+def cli_error_boundary() -> Iterator[None]:
+    """Report errors raised by a download command body and exit with status 1."""
+    from config.error_handling import ConfigurationError, ValidationError, YouTubeDownloaderError
+    
+    cli_app = get_cli_app()
+    try:
+        yield
+    except (ConfigurationError, ValidationError) as e:
+        cli_app.display_error(f"Configuration error: {e.message}")
+        sys.exit(1)
+    except YouTubeDownloaderError as e:
+        cli_app.display_error(f"Download error: {e.message}")
+        sys.exit(1)
+    except Exception as e:
+        cli_app.display_error(f"Unexpected error: {str(e)}")
+        sys.exit(1)
@@ -0,0 +1,90 @@
+"""
+Download archive management command for the YouTube Video Downloader CLI.
+"""
+
+import click
+import sys
+from itertools import islice
+from pathlib import Path
+
+
+@click.command()
+@click.option('--archive-dir', '-d',
+              type=click.Path(path_type=Path),
+              default='./downloads',
+              help='Directory containing the download archive')
+@click.option('--action',
+              type=click.Choice(['stats', 'duplicates', 'cleanup', 'export']),
+              required=True,
+              help='Archive management action to perform')
+@click.option('--export-path',
+              type=click.Path(path_type=Path),
+              help='Path for archive export (required for export action)')
+@click.pass_context
+def archive(ctx, archive_dir, action, export_path):
+    """Manage download archive and detect duplicates."""
+    try:
+        from services.archive_manager import ArchiveManager
+        
+        archive_manager = ArchiveManager(str(archive_dir))
+        
+        if action == 'stats':
+            stats = archive_manager.get_archive_stats()
+            lines = [
+                "Archive Statistics:",
+                f"Total downloads: {stats.get('total_downloads', 0)}",
+                f"Total size: {stats.get('total_size', 0) / (1024**3):.2f} GB"
+            ]
+            
+            if 'first_download' in stats:
+                lines.append(f"First download: {stats['first_download']}")
+            if 'last_download' in stats:
+                lines.append(f"Last download: {stats['last_download']}")
+            
+            if 'total_duration_hours' in stats:
+                lines.append(f"Total duration: {stats['total_duration_hours']:.1f} hours")
+            
+            if 'top_uploaders' in stats:
+                lines.append("\nTop uploaders:")
+                for uploader, count in islice(stats['top_uploaders'], 5):
+                    lines.append(f"  {uploader}: {count} videos")
+            
+            click.echo('\n'.join(lines))
+        
+        elif action == 'duplicates':
+            content_duplicates = archive_manager.find_duplicates_by_content()
+            title_duplicates = archive_manager.find_duplicates_by_title()
+            
+            click.echo(f"Found {len(content_duplicates)} groups of content duplicates")
+            click.echo(f"Found {len(title_duplicates)} groups of title duplicates")
+            
+            if content_duplicates:
+                click.echo("\nContent duplicates:")
+                for i, group in enumerate(islice(content_duplicates, 5), 1):
+                    click.echo(f"  Group {i}:")
+                    for record in group:
+                        click.echo(f"    - {record.get('title', 'Unknown')} ({record.get('video_id', 'Unknown')})")
+        
+        elif action == 'cleanup':
+            removed_ids = archive_manager.cleanup_missing_files()
+            click.echo(f"Cleaned up {len(removed_ids)} missing file records")
+            
+            if removed_ids:
+                click.echo("Removed records:")
+                for video_id in islice(removed_ids, 10):  # Show first 10
+                    click.echo(f"  - {video_id}")
+                remaining = len(removed_ids) - 10
+                if remaining > 0:
+                    click.echo(f"  ... and {remaining} more")
+        
+        elif action == 'export':
+            if not export_path:
+                click.echo("Error: --export-path is required for export action")
+                sys.exit(1)
+            
+            archive_manager.export_archive(str(export_path))
+            click.echo(f"Archive exported to: {export_path}")
+        
+    except Exception as e:
+        click.echo(f"Error managing archive: {e}")
+        sys.exit(1)
@@ -0,0 +1,97 @@
+"""
+Batch file download command for the YouTube Video Downloader CLI.
+"""
+
+import click
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from cli.commands._shared import (
+    QUALITY_CHOICE,
+    bootstrap_app,
+    cli_error_boundary,
+    count_batch_urls,
+    format_workflow_summary,
+)
+from cli.main_cli import get_cli_app
+
+if TYPE_CHECKING:
+    from models.core import ProgressInfo
+
+
+def _display_batch_progress(progress: 'ProgressInfo') -> None:
+    """Report completed file counts during a batch download."""
+    if progress.total_files > 1:
+        click.echo(f"Progress: {progress.files_completed}/{progress.total_files} files completed")
+
+
+@click.command()
+@click.argument('batch_file', type=click.Path(exists=True, path_type=Path))
+@click.option('--output', '-o',
+              type=click.Path(path_type=Path),
+              help='Output directory for downloaded files')
+@click.option('--quality', '-q',
+              type=QUALITY_CHOICE,
+              help='Video quality to download')
+@click.option('--parallel', '-p',
+              type=click.IntRange(1, 10),
+              help='Number of parallel downloads (1-10)')
+@click.pass_context
+def batch(ctx, batch_file, **kwargs):
+    """
+    Download videos from a batch file containing URLs.
+    
+    The batch file should contain one URL per line. Lines starting with # are
+    treated as comments and ignored. Empty lines are also ignored.
+    
+    \b
+    BATCH FILE FORMAT:
+    
+    # YouTube Video Downloader Batch File
+    # One URL per line, comments start with #
+    
+    https://www.youtube.com/watch?v=dQw4w9WgXcQ
+    https://youtu.be/another_video_id
+    https://www.youtube.com/playlist?list=PLAYLIST_ID
+    # https://youtu.be/commented_out_video
+    
+    \b
+    EXAMPLES:
+    
+    Basic batch download:
+        youtube-downloader batch urls.txt
+    
+    Batch with parallel processing:
+        youtube-downloader batch urls.txt -p 5
+    
+    Batch with specific quality:
+        youtube-downloader batch urls.txt -q 720p
+    """
+    cli_app = get_cli_app()
+    
+    with cli_error_boundary():
+        # Read and validate batch file
+        url_count = count_batch_urls(batch_file)
+        if not url_count:
+            cli_app.display_error("No valid URLs found in batch file")
+            sys.exit(1)
+        
+        # Initialize application with merged configuration and progress display
+        app, final_config = bootstrap_app(ctx, kwargs, _display_batch_progress)
+        
+        cli_app.display_success(f"Batch download configuration loaded")
+        click.echo(
+            f"Batch file: {batch_file}\n"
+            f"URLs found: {url_count}\n"
+            f"Output directory: {final_config.output_directory}"
+        )
+        
+        # Start batch download
+        click.echo(f"\nStarting batch download...")
+        results = app.download_batch_from_file(str(batch_file), final_config, interactive=False)
+        
+        # Display results summary
+        summary = app.get_workflow_summary(results)
+        
+        click.echo(format_workflow_summary("Batch download completed!", summary))
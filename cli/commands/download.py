@@ -0,0 +1,150 @@
+"""
+Single video download command for the YouTube Video Downloader CLI.
+"""
+
+import click
+import sys
+from pathlib import Path
+
+from cli.commands._shared import (
+    AUDIO_CODEC_CHOICE,
+    AUDIO_FORMAT_CHOICE,
+    QUALITY_CHOICE,
+    SUBTITLE_FORMAT_CHOICE,
+    VIDEO_CODEC_CHOICE,
+    VIDEO_FORMAT_CHOICE,
+    bootstrap_app,
+    cli_error_boundary,
+    is_valid_youtube_url,
+)
+from cli.main_cli import get_cli_app
+
+
+@click.command()
+@click.argument('url')
+@click.option('--output', '-o',
+              type=click.Path(path_type=Path),
+              help='Output directory for downloaded files')
+@click.option('--quality', '-q',
+              type=QUALITY_CHOICE,
+              help='Video quality to download')
+@click.option('--format', '-f',
+              type=VIDEO_FORMAT_CHOICE,
+              help='Video format preference')
+@click.option('--audio-format',
+              type=AUDIO_FORMAT_CHOICE,
+              help='Audio format for audio-only downloads')
+@click.option('--split-timestamps/--no-split-timestamps',
+              default=None,
+              help='Split video based on timestamps in description')
+@click.option('--parallel', '-p',
+              type=click.IntRange(1, 10),
+              help='Number of parallel downloads (1-10)')
+@click.option('--thumbnails/--no-thumbnails',
+              default=None,
+              help='Download video thumbnails')
+@click.option('--metadata/--no-metadata',
+              default=None,
+              help='Save video metadata')
+@click.option('--resume/--no-resume',
+              default=None,
+              help='Resume interrupted downloads')
+@click.option('--retries',
+              type=click.IntRange(0, 10),
+              help='Number of retry attempts (0-10)')
+@click.option('--video-codec',
+              type=VIDEO_CODEC_CHOICE,
+              help='Preferred video codec')
+@click.option('--audio-codec',
+              type=AUDIO_CODEC_CHOICE,
+              help='Preferred audio codec')
+@click.option('--container',
+              type=VIDEO_FORMAT_CHOICE,
+              help='Preferred container format')
+@click.option('--subtitles/--no-subtitles',
+              default=None,
+              help='Download video subtitles')
+@click.option('--subtitle-languages',
+              default=None,
+              help='Comma-separated list of subtitle languages (e.g., en,es,fr)')
+@click.option('--subtitle-format',
+              type=SUBTITLE_FORMAT_CHOICE,
+              help='Subtitle format preference')
+@click.option('--auto-subs/--no-auto-subs',
+              default=None,
+              help='Include auto-generated subtitles')
+@click.option('--archive/--no-archive',
+              default=None,
+              help='Use download archive to track downloads')
+@click.option('--skip-duplicates/--no-skip-duplicates',
+              default=None,
+              help='Skip videos that are already in the archive')
+@click.option('--interactive/--no-interactive',
+              default=False,
+              help='Enable interactive mode for timestamp splitting decisions')
+@click.pass_context
+def download(ctx, url, interactive, **kwargs):
+    """
+    Download a single YouTube video.
+    
+    \b
+    EXAMPLES:
+    
+    Basic download:
+        youtube-downloader download "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    
+    Download with specific quality and format:
+        youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" -q 720p -f mp4
+    
+    Download with timestamp splitting:
+        youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" --split-timestamps
+    
+    Interactive mode (prompts for splitting):
+        youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" --interactive
+    
+    Download with subtitles:
+        youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" --subtitles --subtitle-languages en,es
+    
+    Audio-only download:
+        youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" --audio-format mp3
+    """
+    cli_app = get_cli_app()
+    
+    with cli_error_boundary():
+        # Validate URL
+        if not is_valid_youtube_url(url):
+            cli_app.display_error("Invalid YouTube URL provided")
+            sys.exit(1)
+        
+        # Initialize application with merged configuration and progress display
+        app, final_config = bootstrap_app(ctx, kwargs, cli_app.display_progress)
+        
+        cli_app.display_success("Starting single video download...")
+        click.echo(
+            f"URL: {url}\n"
+            f"Output directory: {final_config.output_directory}\n"
+            f"Quality: {final_config.quality}\n"
+            f"Format: {final_config.format_preference}"
+        )
+        
+        # Perform download
+        result = app.download_single_video(url, final_config, interactive=interactive)
+        
+        # Display results
+        if result.success:
+            cli_app.display_success(f"Download completed successfully!")
+            lines = [f"Video saved to: {result.video_path}"]
+            
+            if result.split_files:
+                lines.append(f"Video split into {len(result.split_files)} chapters")
+            
+            if result.metadata_path:
+                lines.append(f"Metadata saved to: {result.metadata_path}")
+            
+            if result.thumbnail_path:
+                lines.append(f"Thumbnail saved to: {result.thumbnail_path}")
+            
+            click.echo('\n'.join(lines))
+        else:
+            cli_app.display_error(f"Download failed: {result.error_message}")
+            sys.exit(1)
@@ -0,0 +1,148 @@
+"""
+Usage examples command for the YouTube Video Downloader CLI.
+"""
+
+import click
+
+
+_EXAMPLES_TEXT = """
+YouTube Video Downloader - Comprehensive Usage Examples
+
+═══════════════════════════════════════════════════════════════════════════════
+
+BASIC DOWNLOADS:
+
+  Single video download:
+    youtube-downloader download "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+  Download to specific directory:
+    youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" -o ~/Downloads/Videos
+
+  Download specific quality:
+    youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" -q 720p
+
+  Download audio only:
+    youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" --audio-format mp3
+
+═══════════════════════════════════════════════════════════════════════════════
+
+ADVANCED FEATURES:
+
+  Download with timestamp splitting:
+    youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" --split-timestamps
+
+  Interactive mode (prompts for splitting decisions):
+    youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" --interactive
+
+  Download with subtitles:
+    youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" --subtitles --subtitle-languages en,es
+
+  Download with metadata and thumbnails:
+    youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" --metadata --thumbnails
+
+═══════════════════════════════════════════════════════════════════════════════
+
+PLAYLIST DOWNLOADS:
+
+  Download entire playlist:
+    youtube-downloader playlist "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLMHjMZOz59Oq8HmPME"
+
+  Playlist with parallel downloads:
+    youtube-downloader playlist "https://www.youtube.com/playlist?list=PLAYLIST_ID" -p 3
+
+  Playlist with splitting options:
+    youtube-downloader playlist "https://www.youtube.com/playlist?list=PLAYLIST_ID" --split-timestamps
+
+═══════════════════════════════════════════════════════════════════════════════
+
+BATCH DOWNLOADS:
+
+  Create batch file (urls.txt):
+    # One URL per line, comments start with #
+    https://www.youtube.com/watch?v=dQw4w9WgXcQ
+    https://youtu.be/another_video_id
+    # https://youtu.be/commented_out_video
+
+  Download from batch file:
+    youtube-downloader batch urls.txt
+
+  Batch download with parallel processing:
+    youtube-downloader batch urls.txt -p 5
+
+═══════════════════════════════════════════════════════════════════════════════
+
+CONFIGURATION:
+
+  Generate default configuration:
+    youtube-downloader init-config
+
+  Generate config in specific location:
+    youtube-downloader init-config -o ~/my-config.json
+
+  Use custom configuration:
+    youtube-downloader --config ~/my-config.json download "https://youtu.be/dQw4w9WgXcQ"
+
+  Validate configuration:
+    youtube-downloader validate-config
+
+═══════════════════════════════════════════════════════════════════════════════
+
+ARCHIVE MANAGEMENT:
+
+  View download statistics:
+    youtube-downloader archive --action stats
+
+  Find duplicate downloads:
+    youtube-downloader archive --action duplicates
+
+  Clean up missing files from archive:
+    youtube-downloader archive --action cleanup
+
+  Export archive data:
+    youtube-downloader archive --action export --export-path archive-backup.json
+
+═══════════════════════════════════════════════════════════════════════════════
+
+QUALITY AND FORMAT OPTIONS:
+
+  Quality options: worst, best, 144p, 240p, 360p, 480p, 720p, 1080p, 1440p, 2160p
+  Video formats: mp4, webm, mkv
+  Audio formats: mp3, m4a, ogg, wav
+  Video codecs: h264, h265, vp9, av1
+  Audio codecs: aac, mp3, opus
+
+  Example with specific codec preferences:
+    youtube-downloader download "https://youtu.be/dQw4w9WgXcQ" --video-codec h264 --audio-codec aac
+
+═══════════════════════════════════════════════════════════════════════════════
+
+LOGGING AND DEBUGGING:
+
+  Enable debug logging:
+    youtube-downloader --log-level DEBUG download "https://youtu.be/dQw4w9WgXcQ"
+
+  Save logs to file:
+    youtube-downloader --log-file download.log download "https://youtu.be/dQw4w9WgXcQ"
+
+═══════════════════════════════════════════════════════════════════════════════
+
+TIPS:
+
+  • Use quotes around URLs to avoid shell interpretation issues
+  • The --interactive flag is useful for deciding splitting on a per-video basis
+  • Parallel downloads (-p) can speed up playlist/batch downloads significantly
+  • Use --archive to avoid re-downloading the same videos
+  • Configuration files allow you to set default preferences
+  • Check logs if downloads fail - they contain detailed error information
+
+For detailed help on any command, use:
+  youtube-downloader COMMAND --help
+
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+
+@click.command()
+def help_examples():
+    """Show comprehensive usage examples and tips."""
+    click.echo(_EXAMPLES_TEXT)
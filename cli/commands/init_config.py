@@ -0,0 +1,30 @@
+"""
+Configuration file generation command for the YouTube Video Downloader CLI.
+"""
+
+import click
+import sys
+from pathlib import Path
+
+from cli.main_cli import get_cli_app
+
+
+@click.command()
+@click.option('--output', '-o',
+              type=click.Path(path_type=Path),
+              default='./youtube_downloader_config.json',
+              help='Output path for configuration file')
+def init_config(output):
+    """Generate a default configuration file."""
+    from config.error_handling import ConfigurationError
+    
+    cli_app = get_cli_app()
+    
+    try:
+        cli_app.config_manager.save_default_config(output)
+        cli_app.display_success(f"Default configuration saved to: {output}")
+        click.echo("You can now edit this file to customize your settings.")
+        
+    except ConfigurationError as e:
+        cli_app.display_error(f"Failed to create configuration file: {e.message}")
+        sys.exit(1)
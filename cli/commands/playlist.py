@@ -0,0 +1,110 @@
+"""
+Playlist download command for the YouTube Video Downloader CLI.
+"""
+
+import click
+import sys
+from pathlib import Path
+
+from cli.commands._shared import (
+    QUALITY_CHOICE,
+    SUBTITLE_FORMAT_CHOICE,
+    VIDEO_FORMAT_CHOICE,
+    bootstrap_app,
+    cli_error_boundary,
+    format_workflow_summary,
+    is_valid_youtube_playlist_url,
+)
+from cli.main_cli import get_cli_app
+
+
+@click.command()
+@click.argument('playlist_url')
+@click.option('--output', '-o',
+              type=click.Path(path_type=Path),
+              help='Output directory for downloaded files')
+@click.option('--quality', '-q',
+              type=QUALITY_CHOICE,
+              help='Video quality to download')
+@click.option('--format', '-f',
+              type=VIDEO_FORMAT_CHOICE,
+              help='Video format preference')
+@click.option('--parallel', '-p',
+              type=click.IntRange(1, 10),
+              help='Number of parallel downloads (1-10)')
+@click.option('--split-timestamps/--no-split-timestamps',
+              default=None,
+              help='Split videos based on timestamps in descriptions')
+@click.option('--thumbnails/--no-thumbnails',
+              default=None,
+              help='Download video thumbnails')
+@click.option('--metadata/--no-metadata',
+              default=None,
+              help='Save video metadata')
+@click.option('--subtitles/--no-subtitles',
+              default=None,
+              help='Download video subtitles')
+@click.option('--subtitle-languages',
+              default=None,
+              help='Comma-separated list of subtitle languages (e.g., en,es,fr)')
+@click.option('--subtitle-format',
+              type=SUBTITLE_FORMAT_CHOICE,
+              help='Subtitle format preference')
+@click.option('--archive/--no-archive',
+              default=None,
+              help='Use download archive to track downloads')
+@click.option('--skip-duplicates/--no-skip-duplicates',
+              default=None,
+              help='Skip videos that are already in the archive')
+@click.option('--interactive/--no-interactive',
+              default=False,
+              help='Enable interactive mode for timestamp splitting decisions')
+@click.pass_context
+def playlist(ctx, playlist_url, interactive, **kwargs):
+    """
+    Download an entire YouTube playlist.
+    
+    \b
+    EXAMPLES:
+    
+    Basic playlist download:
+        youtube-downloader playlist "https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLMHjMZOz59Oq8HmPME"
+    
+    Playlist with parallel downloads:
+        youtube-downloader playlist "https://www.youtube.com/playlist?list=PLAYLIST_ID" -p 3
+    
+    Playlist with timestamp splitting:
+        youtube-downloader playlist "https://www.youtube.com/playlist?list=PLAYLIST_ID" --split-timestamps
+    
+    Interactive playlist (per-video splitting decisions):
+        youtube-downloader playlist "https://www.youtube.com/playlist?list=PLAYLIST_ID" --interactive
+    """
+    cli_app = get_cli_app()
+    
+    with cli_error_boundary():
+        # Validate playlist URL
+        if not is_valid_youtube_playlist_url(playlist_url):
+            cli_app.display_error("Invalid YouTube playlist URL provided")
+            sys.exit(1)
+        
+        # Initialize application with merged configuration and progress display
+        app, final_config = bootstrap_app(ctx, kwargs, cli_app.display_progress)
+        
+        cli_app.display_success("Starting playlist download...")
+        click.echo(
+            f"Playlist URL: {playlist_url}\n"
+            f"Output directory: {final_config.output_directory}\n"
+            f"Parallel downloads: {final_config.max_parallel_downloads}"
+        )
+        
+        # Perform playlist download
+        results = app.download_playlist(playlist_url, final_config, interactive=interactive)
+        
+        # Display results summary
+        summary = app.get_workflow_summary(results)
+        
+        click.echo(format_workflow_summary("Playlist download completed!", summary))
+        
+        # Exit with error code if any downloads failed
+        if summary['failed_downloads'] > 0:
+            sys.exit(1)
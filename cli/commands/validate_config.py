@@ -0,0 +1,44 @@
+"""
+Configuration validation command for the YouTube Video Downloader CLI.
+"""
+
+import click
+import sys
+from pathlib import Path
+
+from cli.main_cli import get_cli_app
+
+
+@click.command()
+@click.option('--config', '-c',
+              type=click.Path(exists=True, path_type=Path),
+              help='Path to configuration file to validate')
+def validate_config(config):
+    """Validate a configuration file."""
+    from config.error_handling import ConfigurationError
+    
+    cli_app = get_cli_app()
+    
+    try:
+        if not config:
+            config = cli_app.config_manager.get_config_path()
+        
+        # Try to load the configuration
+        loaded_config = cli_app.config_manager.load_config(config)
+        cli_app.display_success(f"Configuration file is valid: {config}")
+        
+        # Display configuration summary
+        click.echo(
+            "\nConfiguration Summary:\n"
+            f"  Output Directory: {loaded_config.output_directory}\n"
+            f"  Quality: {loaded_config.quality}\n"
+            f"  Format: {loaded_config.format_preference}\n"
+            f"  Parallel Downloads: {loaded_config.max_parallel_downloads}\n"
+            f"  Split Timestamps: {loaded_config.split_timestamps}\n"
+            f"  Save Thumbnails: {loaded_config.save_thumbnails}\n"
+            f"  Save Metadata: {loaded_config.save_metadata}"
+        )
+        
+    except ConfigurationError as e:
+        cli_app.display_error(f"Configuration validation failed: {e.message}")
+        sys.exit(1)
@@ -2,21 +2,50 @@
 Interface definitions for CLI components.
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from models.core import DownloadConfig, ProgressInfo
+from typing import TYPE_CHECKING, List, Dict, Any
+
+if TYPE_CHECKING:
+    from models.core import DownloadConfig, ProgressInfo
+
+
+# Anchored YouTube URL patterns, compiled once and shared by the CLI commands
+# and the workflow manager
+YOUTUBE_URL_RE = re.compile(
+    r'^(?:https?://)?(?:[\w-]+\.)*(?:youtube\.com|youtu\.be)(?:/|$)', re.IGNORECASE
+)
+YOUTUBE_PLAYLIST_RE = re.compile(
+    r'^(?:https?://)?(?:[\w-]+\.)*(?:youtube\.com|youtu\.be)(?=/|$).*?(?:[?&]list=|/playlist\b)',
+    re.IGNORECASE
+)
+
+# Supported option values, shared by the CLI commands and ArgumentValidator
+QUALITY_CHOICES = ('worst', 'best', '144p', '240p', '360p', '480p', '720p', '1080p', '1440p', '2160p')
+VIDEO_FORMAT_CHOICES = ('mp4', 'webm', 'mkv')
+AUDIO_FORMAT_CHOICES = ('mp3', 'm4a', 'ogg', 'wav')
+VIDEO_CODEC_CHOICES = ('h264', 'h265', 'vp9', 'av1')
+AUDIO_CODEC_CHOICES = ('aac', 'mp3', 'opus')
+SUBTITLE_FORMAT_CHOICES = ('srt', 'vtt', 'ass', 'ttml')
+
+_VALID_QUALITIES = frozenset(QUALITY_CHOICES)
+_VALID_FORMATS = frozenset(VIDEO_FORMAT_CHOICES)
+
+# Characters rejected in output paths and replaced in filenames
+_INVALID_PATH_CHARS = frozenset('<>"|?*')
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
 
 
 class CLIInterface(ABC):
     """Interface for command-line interface operations."""
     
     @abstractmethod
-    def parse_arguments(self, args: List[str]) -> DownloadConfig:
+    def parse_arguments(self, args: List[str]) -> 'DownloadConfig':
         """Parse command-line arguments and return configuration."""
         pass
     
     @abstractmethod
-    def display_progress(self, progress: ProgressInfo) -> None:
+    def display_progress(self, progress: 'ProgressInfo') -> None:
         """Display progress information to the user."""
         pass
     
@@ -45,8 +74,7 @@ class ArgumentValidator:
         if not url or not isinstance(url, str):
             return False
         
-        youtube_domains = ['youtube.com', 'youtu.be', 'www.youtube.com', 'm.youtube.com']
-        return any(domain in url.lower() for domain in youtube_domains)
+        return YOUTUBE_URL_RE.match(url) is not None
     
     @staticmethod
     def validate_output_path(path: str) -> bool:
@@ -56,18 +84,17 @@ class ArgumentValidator:
         
         # Basic path validation - check for invalid characters
         # Note: backslash is valid for Windows paths, colon is valid for drive letters
-        invalid_chars = ['<', '>', '"', '|', '?', '*']
+        if not _INVALID_PATH_CHARS.isdisjoint(path):
+            return False
         
         # Allow colon only if it's part of a Windows drive letter (e.g., C:)
-        if ':' in path:
-            # Check if colon is in a valid position for Windows drive letter
-            colon_positions = [i for i, char in enumerate(path) if char == ':']
-            for pos in colon_positions:
-                # Valid if it's at position 1 (like C:) or preceded by a drive letter
-                if pos != 1 or not path[pos-1].isalpha():
-                    return False
+        colon_pos = path.find(':')
+        if colon_pos != -1:
+            # Valid only at position 1 after a drive letter, with no other colons
+            if colon_pos != 1 or not path[0].isalpha() or path.find(':', 2) != -1:
+                return False
         
-        return not any(char in path for char in invalid_chars)
+        return True
     
     @staticmethod
     def sanitize_filename(filename: str) -> str:
@@ -75,14 +102,9 @@ class ArgumentValidator:
         if not filename:
             return "untitled"
         
-        # Replace invalid characters with underscores
-        invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        sanitized = filename
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, '_')
-        
+        # Replace invalid characters with underscores in a single pass
         # Remove leading/trailing whitespace and dots
-        sanitized = sanitized.strip(' .')
+        sanitized = filename.translate(_SANITIZE_TABLE).strip(' .')
         
         # Ensure filename is not empty after sanitization
         return sanitized if sanitized else "untitled"
@@ -90,14 +112,12 @@ class ArgumentValidator:
     @staticmethod
     def validate_quality(quality: str) -> bool:
         """Validate video quality setting."""
-        valid_qualities = ['worst', 'best', '144p', '240p', '360p', '480p', '720p', '1080p', '1440p', '2160p']
-        return quality in valid_qualities
+        return isinstance(quality, str) and quality in _VALID_QUALITIES
     
     @staticmethod
     def validate_format(format_name: str) -> bool:
         """Validate video format setting."""
-        valid_formats = ['mp4', 'webm', 'mkv']
-        return format_name in valid_formats
+        return isinstance(format_name, str) and format_name in _VALID_FORMATS
     
     @staticmethod
     def validate_parallel_count(count: int) -> bool:
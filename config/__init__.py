@@ -2,8 +2,33 @@
 Configuration management components for the YouTube Video Downloader application.
 """
 
-from .logging_config import setup_logging, get_logger
-from .error_handling import ErrorHandler, YouTubeDownloaderError
-from .config_manager import ConfigManager
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ['setup_logging', 'get_logger', 'ErrorHandler', 'YouTubeDownloaderError', 'ConfigManager']
\ No newline at end of file
+if TYPE_CHECKING:
+    from .logging_config import setup_logging, get_logger
+    from .error_handling import ErrorHandler, YouTubeDownloaderError
+    from .config_manager import ConfigManager
+
+# Re-exported names and the submodules defining them. They are imported on
+# first access so that importing one submodule, e.g. config.error_handling,
+# does not load the others.
+_LAZY_EXPORTS = {
+    'setup_logging': '.logging_config',
+    'get_logger': '.logging_config',
+    'ErrorHandler': '.error_handling',
+    'YouTubeDownloaderError': '.error_handling',
+    'ConfigManager': '.config_manager',
+}
+
+__all__ = ['setup_logging', 'get_logger', 'ErrorHandler', 'YouTubeDownloaderError', 'ConfigManager']
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name on first access and cache it."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -2,21 +2,105 @@
 Configuration management for the YouTube Video Downloader application.
 """
 
+import copy
 import json
+from dataclasses import replace
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Union
 import logging
 
 from models.core import DownloadConfig, FormatPreferences
 from config.error_handling import ConfigurationError, ValidationError
 
 
+# Default configuration values. Shared by every ConfigManager and never
+# mutated: merges copy it and DownloadConfig construction copies its lists.
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "output_directory": "./downloads",
+    "quality": "best",
+    "format_preference": "mp4",
+    "audio_format": "mp3",
+    "split_timestamps": False,
+    "max_parallel_downloads": 3,
+    "save_thumbnails": True,
+    "save_metadata": True,
+    "resume_downloads": True,
+    "retry_attempts": 3,
+    "download_subtitles": False,
+    "subtitle_languages": ["en"],
+    "subtitle_format": "srt",
+    "auto_generated_subtitles": True,
+    "use_archive": True,
+    "skip_duplicates": True,
+    "format_preferences": {
+        "video_codec": "h264",
+        "audio_codec": "aac",
+        "container": "mp4",
+        "prefer_free_formats": False
+    }
+}
+
+# Fields every configuration dictionary must define, in schema order
+_REQUIRED_FIELDS = (
+    'output_directory', 'quality', 'format_preference', 'audio_format',
+    'split_timestamps', 'max_parallel_downloads', 'save_thumbnails',
+    'save_metadata', 'resume_downloads', 'retry_attempts', 'download_subtitles',
+    'subtitle_languages', 'subtitle_format', 'auto_generated_subtitles',
+    'use_archive', 'skip_duplicates'
+)
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+# (field, expected type, minimum value or None, error message)
+_FIELD_CHECKS = (
+    ('output_directory', str, None, "output_directory must be a string"),
+    ('quality', str, None, "quality must be a string"),
+    ('max_parallel_downloads', int, 1, "max_parallel_downloads must be a positive integer"),
+    ('retry_attempts', int, 0, "retry_attempts must be a non-negative integer"),
+)
+
+# CLI argument names mapped to the config fields they override
+_CLI_ARG_FIELDS = {
+    'output': 'output_directory',
+    'quality': 'quality',
+    'format': 'format_preference',
+    'audio_format': 'audio_format',
+    'split_timestamps': 'split_timestamps',
+    'parallel': 'max_parallel_downloads',
+    'thumbnails': 'save_thumbnails',
+    'metadata': 'save_metadata',
+    'resume': 'resume_downloads',
+    'retries': 'retry_attempts',
+    'subtitles': 'download_subtitles',
+    'subtitle_languages': 'subtitle_languages',
+    'subtitle_format': 'subtitle_format',
+    'auto_subs': 'auto_generated_subtitles',
+    'archive': 'use_archive',
+    'skip_duplicates': 'skip_duplicates'
+}
+
+# CLI arguments that override format_preferences fields of the same name
+_CLI_FORMAT_ARGS = frozenset({'video_codec', 'audio_codec', 'container'})
+
+# Codecs accepted without a warning
+_KNOWN_CODECS = frozenset({'h264', 'h265', 'vp9', 'av1', 'aac', 'mp3', 'opus'})
+
+
+def _copy_languages(languages: Any) -> Any:
+    """Copy a subtitle language list, passing any other value through unchanged."""
+    return list(languages) if isinstance(languages, (list, tuple)) else languages
+
+
 class ConfigManager:
     """Manages configuration loading, validation, and merging."""
     
     DEFAULT_CONFIG_FILENAME = "youtube_downloader_config.json"
     
+    # Validated configuration dictionaries shared by all instances, keyed by
+    # (device, inode) with the file's (mtime in ns, size) when it was cached;
+    # editing a file replaces its entry rather than adding one
+    _config_cache: Dict[Tuple[int, int], Tuple[int, int, Dict[str, Any]]] = {}
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         """
         Initialize ConfigManager.
@@ -25,34 +109,11 @@ class ConfigManager:
             logger: Optional logger instance
         """
         self.logger = logger or logging.getLogger(__name__)
-        self._default_config = self._create_default_config()
+        self._default_config = _DEFAULT_CONFIG
     
     def _create_default_config(self) -> Dict[str, Any]:
         """Create default configuration dictionary."""
-        return {
-            "output_directory": "./downloads",
-            "quality": "best",
-            "format_preference": "mp4",
-            "audio_format": "mp3",
-            "split_timestamps": False,
-            "max_parallel_downloads": 3,
-            "save_thumbnails": True,
-            "save_metadata": True,
-            "resume_downloads": True,
-            "retry_attempts": 3,
-            "download_subtitles": False,
-            "subtitle_languages": ["en"],
-            "subtitle_format": "srt",
-            "auto_generated_subtitles": True,
-            "use_archive": True,
-            "skip_duplicates": True,
-            "format_preferences": {
-                "video_codec": "h264",
-                "audio_codec": "aac",
-                "container": "mp4",
-                "prefer_free_formats": False
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
     
     def load_config(self, config_path: Union[str, Path]) -> DownloadConfig:
         """
@@ -67,12 +128,20 @@ class ConfigManager:
         Raises:
             ConfigurationError: If configuration file cannot be loaded or is invalid
         """
-        config_path = Path(config_path)
+        if not isinstance(config_path, Path):
+            config_path = Path(config_path)
         
-        if not config_path.exists():
+        try:
+            stat = config_path.stat()
+        except OSError:
             self.logger.warning(f"Configuration file not found: {config_path}")
             return self._create_download_config(self._default_config)
         
+        cached_config = self._get_cached_config(stat)
+        if cached_config is not None:
+            self.logger.debug(f"Using cached configuration for: {config_path}")
+            return self._create_download_config(cached_config)
+        
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 config_data = json.load(f)
@@ -85,6 +154,7 @@ class ConfigManager:
             # Validate the configuration
             self._validate_config(merged_config)
             
+            self._set_cached_config(stat, merged_config)
             return self._create_download_config(merged_config)
             
         except json.JSONDecodeError as e:
@@ -110,7 +180,8 @@ class ConfigManager:
         Raises:
             ConfigurationError: If configuration cannot be saved
         """
-        config_path = Path(config_path)
+        if not isinstance(config_path, Path):
+            config_path = Path(config_path)
         
         try:
             # Create directory if it doesn't exist
@@ -120,7 +191,11 @@ class ConfigManager:
             config_dict = self._download_config_to_dict(config)
             
             with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
+                f.write(json.dumps(config_dict, indent=2, ensure_ascii=False))
+            
+            # The file holds exactly this dict, so reloading it needs no parsing
+            config_dict['subtitle_languages'] = _copy_languages(config_dict['subtitle_languages'])
+            self._cache_written_config(config_path, config_dict)
             
             self.logger.info(f"Configuration saved to: {config_path}")
             
@@ -141,14 +216,17 @@ class ConfigManager:
         Raises:
             ConfigurationError: If default configuration cannot be saved
         """
-        output_path = Path(output_path)
+        if not isinstance(output_path, Path):
+            output_path = Path(output_path)
         
         try:
             # Create directory if it doesn't exist
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(self._default_config, f, indent=2, ensure_ascii=False)
+                f.write(json.dumps(self._default_config, indent=2, ensure_ascii=False))
+            
+            self._cache_written_config(output_path, self._default_config)
             
             self.logger.info(f"Default configuration saved to: {output_path}")
             
@@ -159,6 +237,57 @@ class ConfigManager:
                 original_exception=e
             )
     
+    @classmethod
+    def _get_cached_config(cls, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached configuration dict for a file, if still current.
+        
+        Device and inode identify the file however its path is spelled, so no
+        path resolution is needed; a changed mtime or size means the file was
+        edited since it was cached.
+        
+        Args:
+            stat: Current stat of the configuration file
+            
+        Returns:
+            Cached configuration dictionary, or None
+        """
+        entry = cls._config_cache.get((stat.st_dev, stat.st_ino))
+        if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            return None
+        return entry[2]
+    
+    @classmethod
+    def _set_cached_config(cls, stat: os.stat_result, config_dict: Dict[str, Any]) -> None:
+        """
+        Cache a validated configuration dict for a file, replacing any older entry.
+        
+        Args:
+            stat: Stat of the configuration file the dict was read from or written to
+            config_dict: Complete configuration dictionary, not mutated afterwards
+        """
+        cls._config_cache[(stat.st_dev, stat.st_ino)] = (stat.st_mtime_ns, stat.st_size, config_dict)
+    
+    def _cache_written_config(self, config_path: Path, config_dict: Dict[str, Any]) -> None:
+        """
+        Cache a configuration dict that was just written to config_path.
+        
+        Loading a file this process wrote then skips parsing and validation.
+        An invalid configuration is not cached, so loading it raises the same
+        error here as in any other process. Warnings about unusual values are
+        left to loading, as before.
+        
+        Args:
+            config_path: File the configuration was written to
+            config_dict: Complete configuration dictionary, not mutated afterwards
+        """
+        try:
+            self._validate_config(config_dict, warn=False)
+        except ValidationError:
+            return
+        
+        self._set_cached_config(config_path.stat(), config_dict)
+    
     def merge_cli_args(self, config: DownloadConfig, cli_args: Dict[str, Any]) -> DownloadConfig:
         """
         Merge CLI arguments with existing configuration.
@@ -171,47 +300,29 @@ class ConfigManager:
         Returns:
             New DownloadConfig instance with merged values
         """
-        # Convert config to dictionary for easier manipulation
-        config_dict = self._download_config_to_dict(config)
-        
-        # Map CLI argument names to config keys
-        cli_mapping = {
-            'output': 'output_directory',
-            'quality': 'quality',
-            'format': 'format_preference',
-            'audio_format': 'audio_format',
-            'split_timestamps': 'split_timestamps',
-            'parallel': 'max_parallel_downloads',
-            'thumbnails': 'save_thumbnails',
-            'metadata': 'save_metadata',
-            'resume': 'resume_downloads',
-            'retries': 'retry_attempts',
-            'subtitles': 'download_subtitles',
-            'subtitle_languages': 'subtitle_languages',
-            'subtitle_format': 'subtitle_format',
-            'auto_subs': 'auto_generated_subtitles',
-            'archive': 'use_archive',
-            'skip_duplicates': 'skip_duplicates'
-        }
-        
-        # Apply CLI arguments
-        for cli_key, config_key in cli_mapping.items():
-            if cli_key in cli_args and cli_args[cli_key] is not None:
-                config_dict[config_key] = cli_args[cli_key]
-                self.logger.debug(f"CLI override: {config_key} = {cli_args[cli_key]}")
+        # Collect only the overridden fields
+        changed = {}
+        format_changes = {}
+        for cli_key, value in cli_args.items():
+            if value is None:
+                continue
+            config_key = _CLI_ARG_FIELDS.get(cli_key)
+            if config_key is not None:
+                changed[config_key] = value
+                self.logger.debug(f"CLI override: {config_key} = {value}")
+            elif cli_key in _CLI_FORMAT_ARGS:
+                # Handle format preferences separately
+                format_changes[cli_key] = value
         
-        # Handle format preferences separately
-        if 'video_codec' in cli_args and cli_args['video_codec'] is not None:
-            config_dict['format_preferences']['video_codec'] = cli_args['video_codec']
-        if 'audio_codec' in cli_args and cli_args['audio_codec'] is not None:
-            config_dict['format_preferences']['audio_codec'] = cli_args['audio_codec']
-        if 'container' in cli_args and cli_args['container'] is not None:
-            config_dict['format_preferences']['container'] = cli_args['container']
+        # The base config is already valid, so only the overrides need checking
+        self._validate_values({**changed, 'format_preferences': format_changes})
         
-        # Validate merged configuration
-        self._validate_config(config_dict)
+        # Fresh nested objects so the result never aliases the base config
+        changed['format_preferences'] = replace(config.format_preferences, **format_changes)
+        changed['subtitle_languages'] = _copy_languages(
+            changed.get('subtitle_languages', config.subtitle_languages))
         
-        return self._create_download_config(config_dict)
+        return replace(config, **changed)
     
     def _merge_configs(self, base_config: Dict[str, Any], override_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -224,55 +335,53 @@ class ConfigManager:
         Returns:
             Merged configuration dictionary
         """
-        merged = base_config.copy()
+        merged = {**base_config, **override_config}
         
-        for key, value in override_config.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                merged[key] = self._merge_configs(merged[key], value)
-            else:
-                merged[key] = value
+        # format_preferences is the only nested section of the configuration
+        base_prefs = base_config.get('format_preferences')
+        override_prefs = override_config.get('format_preferences')
+        if isinstance(base_prefs, dict) and isinstance(override_prefs, dict):
+            merged['format_preferences'] = {**base_prefs, **override_prefs}
         
         return merged
     
-    def _validate_config(self, config: Dict[str, Any]) -> None:
+    def _validate_config(self, config: Dict[str, Any], warn: bool = True) -> None:
         """
         Validate configuration dictionary.
         
         Args:
             config: Configuration dictionary to validate
+            warn: Whether to log warnings for valid but unusual values
             
         Raises:
             ValidationError: If configuration is invalid
         """
-        required_fields = [
-            'output_directory', 'quality', 'format_preference', 'audio_format',
-            'split_timestamps', 'max_parallel_downloads', 'save_thumbnails',
-            'save_metadata', 'resume_downloads', 'retry_attempts', 'download_subtitles',
-            'subtitle_languages', 'subtitle_format', 'auto_generated_subtitles',
-            'use_archive', 'skip_duplicates'
-        ]
-        
-        # Check required fields
-        for field in required_fields:
-            if field not in config:
-                raise ValidationError(f"Missing required configuration field: {field}")
-        
-        # Validate specific field types and values
-        if not isinstance(config['output_directory'], str):
-            raise ValidationError("output_directory must be a string")
-        
-        if not isinstance(config['quality'], str):
-            raise ValidationError("quality must be a string")
-        
-        if not isinstance(config['max_parallel_downloads'], int) or config['max_parallel_downloads'] < 1:
-            raise ValidationError("max_parallel_downloads must be a positive integer")
-        
-        if config['max_parallel_downloads'] > 10:
-            self.logger.warning("max_parallel_downloads > 10 may cause rate limiting issues")
+        if not config.keys() >= _REQUIRED_FIELD_SET:
+            # Report the first missing field in schema order
+            missing = next(field for field in _REQUIRED_FIELDS if field not in config)
+            raise ValidationError(f"Missing required configuration field: {missing}")
+        
+        self._validate_values(config, warn)
+    
+    def _validate_values(self, config: Dict[str, Any], warn: bool = True) -> None:
+        """
+        Validate the types and ranges of the configuration fields present.
         
-        if not isinstance(config['retry_attempts'], int) or config['retry_attempts'] < 0:
-            raise ValidationError("retry_attempts must be a non-negative integer")
+        Args:
+            config: Full or partial configuration dictionary
+            warn: Whether to log warnings for valid but unusual values
+            
+        Raises:
+            ValidationError: If a present field is invalid
+        """
+        for field, expected_type, minimum, message in _FIELD_CHECKS:
+            if field in config:
+                value = config[field]
+                if not isinstance(value, expected_type) or (minimum is not None and value < minimum):
+                    raise ValidationError(message)
+        
+        if warn and config.get('max_parallel_downloads', 0) > 10:
+            self.logger.warning("max_parallel_downloads > 10 may cause rate limiting issues")
         
         # Validate format preferences if present
         if 'format_preferences' in config:
@@ -280,11 +389,10 @@ class ConfigManager:
             if not isinstance(format_prefs, dict):
                 raise ValidationError("format_preferences must be a dictionary")
             
-            valid_codecs = ['h264', 'h265', 'vp9', 'av1', 'aac', 'mp3', 'opus']
-            if 'video_codec' in format_prefs and format_prefs['video_codec'] not in valid_codecs:
+            if warn and 'video_codec' in format_prefs and format_prefs['video_codec'] not in _KNOWN_CODECS:
                 self.logger.warning(f"Unknown video codec: {format_prefs['video_codec']}")
             
-            if 'audio_codec' in format_prefs and format_prefs['audio_codec'] not in valid_codecs:
+            if warn and 'audio_codec' in format_prefs and format_prefs['audio_codec'] not in _KNOWN_CODECS:
                 self.logger.warning(f"Unknown audio codec: {format_prefs['audio_codec']}")
     
     def _create_download_config(self, config_dict: Dict[str, Any]) -> DownloadConfig:
@@ -318,7 +426,8 @@ class ConfigManager:
             resume_downloads=config_dict['resume_downloads'],
             retry_attempts=config_dict['retry_attempts'],
             download_subtitles=config_dict['download_subtitles'],
-            subtitle_languages=config_dict['subtitle_languages'],
+            # Copied so callers cannot mutate the defaults or cached configs
+            subtitle_languages=_copy_languages(config_dict['subtitle_languages']),
             subtitle_format=config_dict['subtitle_format'],
             auto_generated_subtitles=config_dict['auto_generated_subtitles'],
             use_archive=config_dict['use_archive'],
@@ -3,10 +3,13 @@ Error handling framework for the YouTube Video Downloader application.
 """
 
 import logging
+import random
+import re
 import time
+from collections import Counter
 from enum import Enum
-from typing import Optional, Callable, Any, Dict
-from functools import wraps
+from typing import Optional, Callable, Any, Dict, Tuple
+from functools import lru_cache, wraps
 
 
 class ErrorType(Enum):
@@ -103,53 +106,179 @@ class ValidationError(YouTubeDownloaderError):
 class GeoRestrictedError(ContentError):
     """Error for geo-restricted content."""
     
-    def __init__(self, message: str, country_code: Optional[str] = None, **kwargs):
-        super().__init__(message, **kwargs)
+    SUGGESTED_SOLUTION = "Consider using a VPN or proxy service"
+    
+    def __init__(self, message: str, country_code: Optional[str] = None,
+                 details: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(message, details={
+            **(details or {}),
+            'country_code': country_code,
+            'suggested_solution': self.SUGGESTED_SOLUTION
+        }, **kwargs)
         self.country_code = country_code
-        self.details['country_code'] = country_code
-        self.details['suggested_solution'] = "Consider using a VPN or proxy service"
 
 
 class AgeRestrictedError(ContentError):
     """Error for age-restricted content."""
     
-    def __init__(self, message: str, age_limit: Optional[int] = None, **kwargs):
-        super().__init__(message, **kwargs)
+    SUGGESTED_SOLUTION = "Authentication may be required for age-restricted content"
+    
+    def __init__(self, message: str, age_limit: Optional[int] = None,
+                 details: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(message, details={
+            **(details or {}),
+            'age_limit': age_limit,
+            'suggested_solution': self.SUGGESTED_SOLUTION
+        }, **kwargs)
         self.age_limit = age_limit
-        self.details['age_limit'] = age_limit
-        self.details['suggested_solution'] = "Authentication may be required for age-restricted content"
 
 
 class PrivateVideoError(ContentError):
     """Error for private or deleted videos."""
     
-    def __init__(self, message: str, video_id: Optional[str] = None, **kwargs):
-        super().__init__(message, **kwargs)
+    SUGGESTED_SOLUTION = "Video may be private, deleted, or unavailable"
+    
+    def __init__(self, message: str, video_id: Optional[str] = None,
+                 details: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(message, details={
+            **(details or {}),
+            'video_id': video_id,
+            'suggested_solution': self.SUGGESTED_SOLUTION
+        }, **kwargs)
         self.video_id = video_id
-        self.details['video_id'] = video_id
-        self.details['suggested_solution'] = "Video may be private, deleted, or unavailable"
 
 
 class RateLimitError(NetworkError):
     """Error for rate limiting."""
     
-    def __init__(self, message: str, retry_after: Optional[int] = None, **kwargs):
-        super().__init__(message, **kwargs)
+    SUGGESTED_SOLUTION = "Reduce request frequency"
+    
+    def __init__(self, message: str, retry_after: Optional[int] = None,
+                 details: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(message, details={
+            **(details or {}),
+            'retry_after': retry_after,
+            'suggested_solution': (
+                f"Wait {retry_after} seconds before retrying" if retry_after else self.SUGGESTED_SOLUTION
+            )
+        }, **kwargs)
         self.retry_after = retry_after
-        self.details['retry_after'] = retry_after
-        self.details['suggested_solution'] = f"Wait {retry_after} seconds before retrying" if retry_after else "Reduce request frequency"
+
+
+def _keyword_pattern(*keywords: str) -> 're.Pattern[str]':
+    """Compile keywords into one pattern that finds any of them as a substring."""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+def _lowercase_message(error: BaseException) -> str:
+    """
+    Return the lowercased message of an error, cached on the instance.
+    
+    Classification and each retry decision inspect the same exception, so
+    the message is only stringified and lowercased once.
+    """
+    try:
+        return error._lowercase_message
+    except AttributeError:
+        pass
+    
+    message = str(error).lower()
+    try:
+        error._lowercase_message = message
+    except AttributeError:
+        # Exception types with __slots__ cannot carry the cache
+        pass
+    return message
+
+
+# yt-dlp error classification rules in priority order: keywords matched
+# against the lowercased message, the error class and its message prefix
+_YT_DLP_ERROR_RULES = (
+    (_keyword_pattern('geo', 'country', 'region', 'location', 'not available in your country',
+                      'blocked in your country', 'geographic'),
+     GeoRestrictedError, "Content is geo-restricted: "),
+    (_keyword_pattern('age', 'sign in', 'login', 'account', 'restricted', 'mature'),
+     AgeRestrictedError, "Content is age-restricted: "),
+    (_keyword_pattern('private', 'deleted', 'removed', 'unavailable', 'not found',
+                      '404', 'does not exist'),
+     PrivateVideoError, "Video is private or deleted: "),
+    (_keyword_pattern('rate limit', 'too many requests', '429', 'quota', 'throttle'),
+     RateLimitError, "Rate limited: "),
+    (_keyword_pattern('network', 'connection', 'timeout', 'dns', 'resolve',
+                      'unreachable', 'refused', 'reset'),
+     NetworkError, "Network error: "),
+    (_keyword_pattern('ffmpeg', 'format', 'codec', 'conversion', 'processing'),
+     ProcessingError, "Processing error: "),
+)
+
+# Retry-after hint in a rate limit message
+_RETRY_AFTER_RE = re.compile(r'retry.*?(\d+)')
+
+# Distinct (error type, context) keys tracked in ErrorHandler.error_counts
+_MAX_ERROR_COUNT_KEYS = 10_000
+
+# Lowercased message keywords that mark an error as transient
+_RETRYABLE_NETWORK_RE = _keyword_pattern('timeout', 'connection', 'network', 'dns')
+_RETRYABLE_FILESYSTEM_RE = _keyword_pattern('busy', 'locked', 'temporary')
+_RETRYABLE_CONTENT_RE = _keyword_pattern('temporary', 'unavailable', 'server error', '5xx')
+
+
+@lru_cache(maxsize=512)
+def _classify_yt_dlp_message(error_message: str) -> Tuple[type, str, Optional[int]]:
+    """
+    Match a lowercased yt-dlp error message against the classification rules.
+    
+    yt-dlp repeats the same message across retries of a failing video, so
+    the rule scan is cached per message; callers still build a fresh error
+    around each original exception.
+    
+    Returns:
+        The error class, its message prefix and the retry-after seconds
+        (rate limits only)
+    """
+    for pattern, error_class, prefix in _YT_DLP_ERROR_RULES:
+        if not pattern.search(error_message):
+            continue
+        
+        retry_after = None
+        if error_class is RateLimitError:
+            # Try to extract retry-after value
+            retry_match = _RETRY_AFTER_RE.search(error_message)
+            retry_after = int(retry_match.group(1)) if retry_match else None
+        return error_class, prefix, retry_after
+    
+    # Default to generic content error
+    return ContentError, "Content error: ", None
 
 
 class ErrorHandler:
     """Centralized error handling and recovery mechanisms."""
     
+    # Retry decision method for each error type, None meaning never retry.
+    # handle_error uses the first entry found along the error's MRO, so a
+    # subclass entry takes precedence over its base class.
+    _RETRY_POLICIES: Dict[type, Optional[str]] = {
+        RateLimitError: '_should_retry_rate_limit_error',
+        NetworkError: '_should_retry_network_error',
+        GeoRestrictedError: None,
+        AgeRestrictedError: None,
+        PrivateVideoError: None,
+        ContentError: '_should_retry_content_error',
+        FileSystemError: '_should_retry_filesystem_error',
+        ProcessingError: '_should_retry_processing_error',
+    }
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
-        self.error_counts: Dict[str, int] = {}
+        # Occurrences per (error type, context)
+        self.error_counts: Dict[Tuple[type, str], int] = Counter()
         self.max_retries = 3
         self.base_delay = 1.0  # Base delay for exponential backoff
         self.max_delay = 60.0  # Maximum delay for exponential backoff
         self.jitter_factor = 0.1  # Add randomness to prevent thundering herd
+        self.log_sample_interval = 10.0  # Seconds between logs of an identical error
+        # (last log time, repeats suppressed since) per (error type, context, message)
+        self._log_samples: Dict[Tuple[type, str, str], Tuple[float, int]] = {}
     
     def handle_error(
         self,
@@ -168,34 +297,75 @@ class ErrorHandler:
         Returns:
             True if operation should be retried, False otherwise
         """
-        error_key = f"{type(error).__name__}:{context}"
-        self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
+        error_key = (type(error), context)
+        self.error_counts[error_key] += 1
+        if len(self.error_counts) > _MAX_ERROR_COUNT_KEYS:
+            # Bound memory in long-running processes: keep the most frequent half
+            self.error_counts = Counter(dict(self.error_counts.most_common(_MAX_ERROR_COUNT_KEYS // 2)))
+        
+        should_retry = self._should_retry(error, retry_count)
+        
+        # Log the error; formatting is deferred and skipped when ERROR is disabled.
+        # A failure that will not be retried is always logged.
+        if self.logger.isEnabledFor(logging.ERROR):
+            suppressed_repeats = self._sample_log(error_key, error, force=not should_retry)
+            if suppressed_repeats is not None:
+                self.logger.error(
+                    "Error in %s: %s", context, error,
+                    extra={
+                        'error_type': type(error).__name__,
+                        'retry_count': retry_count,
+                        'context': context,
+                        'error_count': self.error_counts[error_key],
+                        'suppressed_repeats': suppressed_repeats
+                    }
+                )
+        
+        return should_retry
+    
+    def _should_retry(self, error: Exception, retry_count: int) -> bool:
+        """Determine if an error should be retried based on its most specific registered type."""
+        # No policy retries past max_retries, so skip the type dispatch
+        if retry_count >= self.max_retries:
+            return False
+        
+        for error_class in type(error).__mro__:
+            if error_class in self._RETRY_POLICIES:
+                policy = self._RETRY_POLICIES[error_class]
+                if policy is None:
+                    return False  # Don't retry specific content errors
+                return getattr(self, policy)(error, retry_count)
+        
+        return True
+    
+    def _sample_log(self, error_key: Tuple[type, str], error: Exception, force: bool = False) -> Optional[int]:
+        """
+        Rate-limit logging of identical errors.
         
-        # Log the error
-        self.logger.error(
-            f"Error in {context}: {str(error)}",
-            extra={
-                'error_type': type(error).__name__,
-                'retry_count': retry_count,
-                'context': context
-            }
-        )
+        An error with the same type, context and message as one logged less
+        than log_sample_interval seconds ago is not logged again unless forced;
+        it is counted instead and the count reported with the next record.
+        
+        Args:
+            error_key: (error type, context) key of the error
+            error: The exception that occurred
+            force: Log the error even within the sample interval
+            
+        Returns:
+            Number of identical errors suppressed since the last record if the
+            error should be logged now, None otherwise
+        """
+        sample_key = (*error_key, str(error))
+        now = time.monotonic()
+        sample = self._log_samples.get(sample_key)
+        if sample is not None and not force and now - sample[0] < self.log_sample_interval:
+            self._log_samples[sample_key] = (sample[0], sample[1] + 1)
+            return None
         
-        # Determine if we should retry based on error type
-        if isinstance(error, RateLimitError):
-            return self._should_retry_rate_limit_error(error, retry_count)
-        elif isinstance(error, NetworkError):
-            return self._should_retry_network_error(error, retry_count)
-        elif isinstance(error, (GeoRestrictedError, AgeRestrictedError, PrivateVideoError)):
-            return False  # Don't retry specific content errors
-        elif isinstance(error, ContentError):
-            return self._should_retry_content_error(error, retry_count)
-        elif isinstance(error, FileSystemError):
-            return self._should_retry_filesystem_error(error, retry_count)
-        elif isinstance(error, ProcessingError):
-            return self._should_retry_processing_error(error, retry_count)
-        else:
-            return retry_count < self.max_retries
+        if sample is None and len(self._log_samples) >= _MAX_ERROR_COUNT_KEYS:
+            self._log_samples.clear()
+        self._log_samples[sample_key] = (now, 0)
+        return sample[1] if sample is not None else 0
     
     def _should_retry_network_error(self, error: NetworkError, retry_count: int) -> bool:
         """Determine if network error should be retried."""
@@ -203,9 +373,7 @@ class ErrorHandler:
             return False
         
         # Retry on timeout, connection errors, but not on 404, 403, etc.
-        retryable_keywords = ['timeout', 'connection', 'network', 'dns']
-        error_message = str(error).lower()
-        return any(keyword in error_message for keyword in retryable_keywords)
+        return _RETRYABLE_NETWORK_RE.search(_lowercase_message(error)) is not None
     
     def _should_retry_filesystem_error(self, error: FileSystemError, retry_count: int) -> bool:
         """Determine if filesystem error should be retried."""
@@ -213,9 +381,7 @@ class ErrorHandler:
             return False
         
         # Retry on temporary filesystem issues
-        retryable_keywords = ['busy', 'locked', 'temporary']
-        error_message = str(error).lower()
-        return any(keyword in error_message for keyword in retryable_keywords)
+        return _RETRYABLE_FILESYSTEM_RE.search(_lowercase_message(error)) is not None
     
     def _should_retry_processing_error(self, error: ProcessingError, retry_count: int) -> bool:
         """Determine if processing error should be retried."""
@@ -235,28 +401,27 @@ class ErrorHandler:
             return False
         
         # Retry on temporary content issues
-        retryable_keywords = ['temporary', 'unavailable', 'server error', '5xx']
-        error_message = str(error).lower()
-        return any(keyword in error_message for keyword in retryable_keywords)
+        return _RETRYABLE_CONTENT_RE.search(_lowercase_message(error)) is not None
     
     def get_retry_delay(self, retry_count: int, error: Optional[Exception] = None) -> float:
-        """Calculate delay before retry using exponential backoff with jitter."""
-        import random
+        """
+        Calculate delay before retry using exponential backoff with equal jitter.
         
+        Backoff delays are drawn uniformly from the upper half of the capped
+        exponential delay. Rate limit delays add up to jitter_factor on top of
+        retry_after so clients given the same value do not retry in lockstep.
+        """
         # Handle rate limit errors with specific delay
         if isinstance(error, RateLimitError) and error.retry_after:
-            return float(error.retry_after)
-        
-        # Calculate exponential backoff delay
-        delay = self.base_delay * (2 ** retry_count)
-        
-        # Cap at maximum delay
-        delay = min(delay, self.max_delay)
+            retry_after = float(error.retry_after)
+            return retry_after + retry_after * self.jitter_factor * random.random()
         
-        # Add jitter to prevent thundering herd
-        jitter = delay * self.jitter_factor * random.random()
+        # Calculate exponential backoff delay, capped at maximum delay
+        delay = min(self.base_delay * (1 << retry_count), self.max_delay)
         
-        return delay + jitter
+        # Randomize the upper half to prevent thundering herd
+        half = delay / 2
+        return half + half * random.random()
     
     def reset_error_counts(self) -> None:
         """Reset error counters."""
@@ -272,76 +437,11 @@ class ErrorHandler:
         Returns:
             Classified custom error
         """
-        error_message = str(error).lower()
-        
-        # Geo-restriction errors
-        if any(keyword in error_message for keyword in [
-            'geo', 'country', 'region', 'location', 'not available in your country',
-            'blocked in your country', 'geographic'
-        ]):
-            return GeoRestrictedError(
-                f"Content is geo-restricted: {str(error)}",
-                original_exception=error
-            )
-        
-        # Age-restriction errors
-        if any(keyword in error_message for keyword in [
-            'age', 'sign in', 'login', 'account', 'restricted', 'mature'
-        ]):
-            return AgeRestrictedError(
-                f"Content is age-restricted: {str(error)}",
-                original_exception=error
-            )
-        
-        # Private/deleted video errors
-        if any(keyword in error_message for keyword in [
-            'private', 'deleted', 'removed', 'unavailable', 'not found',
-            '404', 'does not exist'
-        ]):
-            return PrivateVideoError(
-                f"Video is private or deleted: {str(error)}",
-                original_exception=error
-            )
-        
-        # Rate limiting errors
-        if any(keyword in error_message for keyword in [
-            'rate limit', 'too many requests', '429', 'quota', 'throttle'
-        ]):
-            # Try to extract retry-after value
-            import re
-            retry_match = re.search(r'retry.*?(\d+)', error_message)
-            retry_after = int(retry_match.group(1)) if retry_match else None
-            
-            return RateLimitError(
-                f"Rate limited: {str(error)}",
-                retry_after=retry_after,
-                original_exception=error
-            )
-        
-        # Network errors
-        if any(keyword in error_message for keyword in [
-            'network', 'connection', 'timeout', 'dns', 'resolve',
-            'unreachable', 'refused', 'reset'
-        ]):
-            return NetworkError(
-                f"Network error: {str(error)}",
-                original_exception=error
-            )
-        
-        # Processing errors (FFmpeg, format issues, etc.)
-        if any(keyword in error_message for keyword in [
-            'ffmpeg', 'format', 'codec', 'conversion', 'processing'
-        ]):
-            return ProcessingError(
-                f"Processing error: {str(error)}",
-                original_exception=error
-            )
-        
-        # Default to generic content error
-        return ContentError(
-            f"Content error: {str(error)}",
-            original_exception=error
-        )
+        error_class, prefix, retry_after = _classify_yt_dlp_message(_lowercase_message(error))
+        message = prefix + str(error)
+        if error_class is RateLimitError:
+            return RateLimitError(message, retry_after=retry_after, original_exception=error)
+        return error_class(message, original_exception=error)
     
     def handle_graceful_degradation(self, error: Exception, operation: str, fallback_action: Optional[Callable] = None) -> Any:
         """
@@ -355,22 +455,43 @@ class ErrorHandler:
         Returns:
             Result of fallback action or None
         """
-        self.logger.warning(
-            f"Non-critical operation failed: {operation} - {str(error)}",
-            extra={'operation': operation, 'error_type': type(error).__name__}
-        )
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                "Non-critical operation failed: %s - %s", operation, error,
+                extra={'operation': operation, 'error_type': type(error).__name__}
+            )
         
         if fallback_action:
             try:
                 return fallback_action()
             except Exception as fallback_error:
                 self.logger.warning(
-                    f"Fallback action also failed for {operation}: {str(fallback_error)}"
+                    "Fallback action also failed for %s: %s", operation, fallback_error
                 )
         
         return None
 
 
+# Whether an exception type's name marks it as a yt-dlp error, memoized per type
+_yt_dlp_error_types: Dict[type, bool] = {}
+
+
+def _is_yt_dlp_error(error: Exception) -> bool:
+    """Check whether an error was raised by yt-dlp (or youtube-dl)."""
+    error_type = type(error)
+    is_yt_dlp = _yt_dlp_error_types.get(error_type)
+    if is_yt_dlp is None:
+        type_name = str(error_type)
+        is_yt_dlp = 'yt_dlp' in type_name or 'youtube_dl' in type_name
+        _yt_dlp_error_types[error_type] = is_yt_dlp
+    if is_yt_dlp:
+        return True
+    
+    # An instance may carry its own __module__
+    module = getattr(error, '__module__', None)
+    return bool(module and 'yt_dlp' in module)
+
+
 def with_error_handling(
     error_handler: Optional[ErrorHandler] = None,
     context: str = "",
@@ -387,30 +508,33 @@ def with_error_handling(
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            handler = error_handler or ErrorHandler()
-            retry_count = 0
+            handler = error_handler
             
-            while retry_count <= max_retries:
+            for retry_count in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
+                    # The default handler is only needed once something fails
+                    if handler is None:
+                        handler = ErrorHandler()
+                    
                     # Classify the error if it's from yt-dlp
                     classified_error = e
-                    if ('yt_dlp' in str(type(e)) or 'youtube_dl' in str(type(e)) or 
-                        (hasattr(e, '__module__') and e.__module__ and 'yt_dlp' in e.__module__)):
+                    if _is_yt_dlp_error(e):
                         classified_error = handler.classify_yt_dlp_error(e)
                     
-                    if not handler.handle_error(classified_error, context or func.__name__, retry_count):
-                        raise classified_error
+                    # The final failure is still counted and logged before raising
+                    if (not handler.handle_error(classified_error, context or func.__name__, retry_count)
+                            or retry_count == max_retries):
+                        if classified_error is e:
+                            raise
+                        raise classified_error from e
                     
-                    if retry_count < max_retries:
-                        delay = handler.get_retry_delay(retry_count, classified_error)
-                        handler.logger.info(f"Retrying in {delay:.1f} seconds (attempt {retry_count + 1}/{max_retries + 1})")
-                        time.sleep(delay)
-                        retry_count += 1
-                    else:
-                        raise classified_error
-            
-            return None  # Should never reach here
+                    delay = handler.get_retry_delay(retry_count, classified_error)
+                    handler.logger.info(
+                        "Retrying in %.1f seconds (attempt %d/%d)",
+                        delay, retry_count + 1, max_retries + 1
+                    )
+                    time.sleep(delay)
         return wrapper
     return decorator
\ No newline at end of file
@@ -3,21 +3,144 @@ File system validation and disk space checking utilities.
 """
 
 import os
+import re
 import shutil
 import stat
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 import logging
 
 from config.error_handling import FileSystemError
 
+# Seconds a shutil.disk_usage result is reused for the same directory
+_DISK_USAGE_CACHE_TTL = 1.0
+
+# Directories remembered by the disk usage cache before it is emptied
+_MAX_DISK_USAGE_CACHE_ENTRIES = 256
+
+# Units for human-readable byte counts, each 1024 times the previous
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Audio bitrates (kbps) per quality used for size estimates
+_AUDIO_BITRATES_KBPS = {
+    'worst': 64,
+    'low': 128,
+    'medium': 192,
+    'high': 256,
+    'best': 320
+}
+
+# Video bitrates (kbps) per quality - rough estimates
+_VIDEO_BITRATES_KBPS = {
+    '144p': 200,
+    '240p': 400,
+    '360p': 800,
+    '480p': 1200,
+    '720p': 2500,
+    '1080p': 5000,
+    '1440p': 10000,
+    '2160p': 20000,  # 4K
+    'worst': 400,
+    'best': 5000
+}
+
+# Filename characters invalid on common filesystems map to '_', control
+# characters are removed
+_FILENAME_TRANSLATION = str.maketrans({
+    **{char: '_' for char in '<>:"/\\|?*'},
+    **{code: None for code in range(32)}
+})
+
+# System directories that downloads must not be written into, matched
+# anywhere in a resolved path in a single scan
+_SUSPICIOUS_PATH_RE = re.compile('|'.join(map(re.escape, [
+    '/etc/', '/usr/', '/bin/', '/sbin/', '/var/',
+    'C:\\Windows\\', 'C:\\Program Files\\', 'C:\\System32\\'
+])))
+
+# Device names reserved on Windows
+_RESERVED_NAMES = frozenset([
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+])
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_filename(filename: str) -> str:
+    """
+    Sanitize a filename; see FileSystemValidator.validate_filename.
+    
+    The result depends only on the filename, so it is cached for filenames
+    validated again, e.g. when a download is retried.
+    """
+    if not filename or filename.strip() == '':
+        raise FileSystemError("Filename cannot be empty")
+    
+    # Replace invalid characters and remove control characters in one pass
+    sanitized = filename.translate(_FILENAME_TRANSLATION)
+    
+    # Handle reserved names on Windows
+    dot_index = sanitized.rfind('.')
+    name_without_ext = sanitized[:dot_index] if dot_index >= 0 else sanitized
+    if name_without_ext.upper() in _RESERVED_NAMES:
+        sanitized = f"_{sanitized}"
+    
+    # Limit length (leave room for extension and path)
+    max_length = 200
+    if len(sanitized) > max_length:
+        # Try to preserve extension
+        if '.' in sanitized:
+            name, ext = sanitized.rsplit('.', 1)
+            name = name[:max_length - len(ext) - 1]
+            sanitized = f"{name}.{ext}"
+        else:
+            sanitized = sanitized[:max_length]
+    
+    # Remove trailing dots and spaces (Windows issue)
+    sanitized = sanitized.rstrip('. ')
+    
+    if not sanitized:
+        raise FileSystemError("Filename became empty after sanitization")
+    
+    return sanitized
+
 
 class FileSystemValidator:
     """Validates file system operations and disk space requirements."""
     
+    __slots__ = ('logger',)
+    
+    # Recent disk usage per absolute path as (monotonic time, usage), shared
+    # by all validators so back-to-back checks make a single statvfs call
+    _disk_usage_cache: Dict[str, Tuple[float, Any]] = {}
+    
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
     
+    def _disk_usage(self, path: str) -> Any:
+        """
+        Return shutil.disk_usage for a path, reusing results younger than
+        _DISK_USAGE_CACHE_TTL seconds.
+        
+        Raises:
+            OSError: If disk usage cannot be determined
+        """
+        key = os.path.abspath(path)
+        now = time.monotonic()
+        cached = self._disk_usage_cache.get(key)
+        if cached is not None and now - cached[0] < _DISK_USAGE_CACHE_TTL:
+            return cached[1]
+        
+        usage = shutil.disk_usage(key)
+        # Start over rather than grow without bound across many directories
+        if cached is None and len(self._disk_usage_cache) >= _MAX_DISK_USAGE_CACHE_ENTRIES:
+            self._disk_usage_cache.clear()
+        self._disk_usage_cache[key] = (now, usage)
+        return usage
+    
     def validate_disk_space(self, output_path: str, estimated_size: int, 
                           safety_margin: float = 0.1) -> bool:
         """
@@ -35,23 +158,26 @@ class FileSystemValidator:
             FileSystemError: If insufficient space or path issues
         """
         try:
-            # Ensure the path exists or can be created
-            path = Path(output_path)
-            if not path.exists():
-                path.mkdir(parents=True, exist_ok=True)
+            # Ensure the path exists or can be created; an empty path is the
+            # current directory
+            directory = output_path or os.curdir
+            if not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
             
             # Get disk usage statistics
-            usage = shutil.disk_usage(str(path))
+            usage = self._disk_usage(directory)
             available_space = usage.free
             
             # Calculate required space with safety margin
             required_space = int(estimated_size * (1 + safety_margin))
             
-            self.logger.debug(
-                f"Disk space check: Available={self._format_bytes(available_space)}, "
-                f"Required={self._format_bytes(required_space)}, "
-                f"Estimated={self._format_bytes(estimated_size)}"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Disk space check: Available=%s, Required=%s, Estimated=%s",
+                    self._format_bytes(available_space),
+                    self._format_bytes(required_space),
+                    self._format_bytes(estimated_size)
+                )
             
             if available_space < required_space:
                 raise FileSystemError(
@@ -88,39 +214,49 @@ class FileSystemValidator:
             FileSystemError: If path validation fails
         """
         try:
-            path = Path(output_path)
+            # An empty path is the current directory
+            directory = output_path or os.curdir
             
-            # Create directory if it doesn't exist
-            if not path.exists():
+            # One stat covers the usual case of an existing directory
+            if not os.path.isdir(directory):
+                # Check the path is not something other than a directory
+                if os.path.exists(directory):
+                    raise FileSystemError(
+                        f"Output path {output_path} exists but is not a directory"
+                    )
+                
+                # Create directory since it doesn't exist
                 try:
-                    path.mkdir(parents=True, exist_ok=True)
+                    os.makedirs(directory, exist_ok=True)
                 except OSError as e:
                     raise FileSystemError(
                         f"Cannot create directory {output_path}: {str(e)}",
                         original_exception=e
                     )
             
-            # Check if path is actually a directory
-            if not path.is_dir():
-                raise FileSystemError(
-                    f"Output path {output_path} exists but is not a directory"
-                )
-            
-            # Test permissions
-            permissions = {
-                'readable': os.access(str(path), os.R_OK),
-                'writable': os.access(str(path), os.W_OK),
-                'executable': os.access(str(path), os.X_OK)
-            }
-            
-            # Check if we can create files
-            test_file = path / '.test_write_permission'
-            try:
-                test_file.touch()
-                test_file.unlink()
-                permissions['can_create_files'] = True
-            except OSError:
-                permissions['can_create_files'] = False
+            # Test permissions, with one access() call when all are granted
+            if os.access(directory, os.R_OK | os.W_OK | os.X_OK):
+                permissions = {'readable': True, 'writable': True, 'executable': True}
+            else:
+                permissions = {
+                    'readable': os.access(directory, os.R_OK),
+                    'writable': os.access(directory, os.W_OK),
+                    'executable': os.access(directory, os.X_OK)
+                }
+            
+            # Check if we can create files. On POSIX access() already applies
+            # ACLs and read-only mounts, and creating an entry needs write and
+            # search permission on the directory; Windows ACLs need a probe.
+            if os.name != 'nt':
+                permissions['can_create_files'] = permissions['writable'] and permissions['executable']
+            else:
+                test_file = os.path.join(directory, '.test_write_permission')
+                try:
+                    os.close(os.open(test_file, os.O_WRONLY | os.O_CREAT))
+                    os.unlink(test_file)
+                    permissions['can_create_files'] = True
+                except OSError:
+                    permissions['can_create_files'] = False
             
             # Validate required permissions
             if not permissions['writable'] or not permissions['can_create_files']:
@@ -130,7 +266,7 @@ class FileSystemValidator:
                     f"Can create files: {permissions['can_create_files']}"
                 )
             
-            self.logger.debug(f"Path permissions validated for {output_path}: {permissions}")
+            self.logger.debug("Path permissions validated for %s: %s", output_path, permissions)
             return permissions
             
         except OSError as e:
@@ -154,16 +290,19 @@ class FileSystemValidator:
             FileSystemError: If path is unsafe
         """
         try:
-            # Resolve the path to handle symlinks and relative paths
-            resolved_path = Path(output_path).resolve()
+            path = Path(output_path)
             
-            # Check for directory traversal attempts
-            path_str = str(resolved_path)
-            if '..' in Path(output_path).parts:
+            # Check for directory traversal attempts before touching the filesystem
+            if '..' in path.parts:
                 raise FileSystemError(
                     f"Directory traversal detected in path: {output_path}"
                 )
             
+            # Resolve the path to handle symlinks and relative paths; every
+            # component is resolved since any of them may be a symlink
+            resolved_path = path.resolve()
+            path_str = str(resolved_path)
+            
             # If base path is provided, ensure we're within it
             if base_path:
                 base_resolved = Path(base_path).resolve()
@@ -175,25 +314,15 @@ class FileSystemValidator:
                     )
             
             # Check for suspicious path components (but allow /tmp/ for testing)
-            suspicious_components = [
-                '/etc/', '/usr/', '/bin/', '/sbin/', '/var/',
-                'C:\\Windows\\', 'C:\\Program Files\\', 'C:\\System32\\'
-            ]
-            
-            # Only check /tmp/ if it's not a temporary directory for testing
-            if '/tmp/' in path_str and not any(temp_marker in path_str for temp_marker in ['tmp', 'temp', 'test']):
-                suspicious_components.append('/tmp/')
-            
-            for component in suspicious_components:
-                if component in path_str:
-                    raise FileSystemError(
-                        f"Path contains suspicious component: {output_path}"
-                    )
+            if _SUSPICIOUS_PATH_RE.search(path_str):
+                raise FileSystemError(
+                    f"Path contains suspicious component: {output_path}"
+                )
             
             # Check path length (some filesystems have limits)
             if len(path_str) > 260:  # Windows MAX_PATH limit
                 self.logger.warning(
-                    f"Path length ({len(path_str)}) may exceed filesystem limits: {output_path}"
+                    "Path length (%d) may exceed filesystem limits: %s", len(path_str), output_path
                 )
             
             return True
@@ -215,7 +344,7 @@ class FileSystemValidator:
             Dictionary with disk usage information
         """
         try:
-            usage = shutil.disk_usage(path)
+            usage = self._disk_usage(path)
             
             return {
                 'total_bytes': usage.total,
@@ -228,7 +357,7 @@ class FileSystemValidator:
             }
             
         except OSError as e:
-            self.logger.error(f"Could not get disk usage for {path}: {e}")
+            self.logger.error("Could not get disk usage for %s: %s", path, e)
             return {}
     
     def estimate_video_size(self, duration: float, quality: str, format_type: str = 'video') -> int:
@@ -244,38 +373,12 @@ class FileSystemValidator:
             Estimated size in bytes
         """
         if format_type == 'audio':
-            # Audio bitrates (kbps)
-            audio_bitrates = {
-                'worst': 64,
-                'low': 128,
-                'medium': 192,
-                'high': 256,
-                'best': 320
-            }
-            bitrate = audio_bitrates.get(quality, 128)
+            bitrate = _AUDIO_BITRATES_KBPS.get(quality, 128)
             # Convert to bytes per second and multiply by duration
             return int((bitrate * 1000 / 8) * duration)
         
         else:
-            # Video bitrates (kbps) - rough estimates
-            video_bitrates = {
-                '144p': 200,
-                '240p': 400,
-                '360p': 800,
-                '480p': 1200,
-                '720p': 2500,
-                '1080p': 5000,
-                '1440p': 10000,
-                '2160p': 20000,  # 4K
-                'worst': 400,
-                'best': 5000
-            }
-            
-            # Extract resolution if quality contains 'p'
-            if quality.endswith('p'):
-                bitrate = video_bitrates.get(quality, 2500)
-            else:
-                bitrate = video_bitrates.get(quality, 2500)
+            bitrate = _VIDEO_BITRATES_KBPS.get(quality, 2500)
             
             # Convert to bytes per second and multiply by duration
             # Add 20% overhead for container and audio
@@ -294,48 +397,7 @@ class FileSystemValidator:
         Raises:
             FileSystemError: If filename cannot be sanitized
         """
-        if not filename or filename.strip() == '':
-            raise FileSystemError("Filename cannot be empty")
-        
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        sanitized = filename
-        
-        for char in invalid_chars:
-            sanitized = sanitized.replace(char, '_')
-        
-        # Remove control characters
-        sanitized = ''.join(char for char in sanitized if ord(char) >= 32)
-        
-        # Handle reserved names on Windows
-        reserved_names = [
-            'CON', 'PRN', 'AUX', 'NUL',
-            'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-        ]
-        
-        name_without_ext = sanitized.rsplit('.', 1)[0] if '.' in sanitized else sanitized
-        if name_without_ext.upper() in reserved_names:
-            sanitized = f"_{sanitized}"
-        
-        # Limit length (leave room for extension and path)
-        max_length = 200
-        if len(sanitized) > max_length:
-            # Try to preserve extension
-            if '.' in sanitized:
-                name, ext = sanitized.rsplit('.', 1)
-                name = name[:max_length - len(ext) - 1]
-                sanitized = f"{name}.{ext}"
-            else:
-                sanitized = sanitized[:max_length]
-        
-        # Remove trailing dots and spaces (Windows issue)
-        sanitized = sanitized.rstrip('. ')
-        
-        if not sanitized:
-            raise FileSystemError("Filename became empty after sanitization")
-        
-        return sanitized
+        return _sanitize_filename(filename)
     
     def check_file_locks(self, file_path: str) -> bool:
         """
@@ -348,24 +410,23 @@ class FileSystemValidator:
             True if file is accessible, False if locked or doesn't exist
         """
         try:
-            # Check if file exists first
-            if not os.path.exists(file_path):
-                return False
-            
-            # Try to open the file in append mode
-            with open(file_path, 'a'):
-                pass
+            # Try to open the file for appending; without O_CREAT a missing
+            # file fails the open, so no separate existence check is needed
+            os.close(os.open(file_path, os.O_WRONLY | os.O_APPEND))
             return True
-        except (OSError, IOError):
+        except OSError:
             return False
     
     def _format_bytes(self, bytes_value: int) -> str:
         """Format bytes into human-readable string."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
+        # Each unit spans 10 bits; values beyond TB are all shown in PB
+        unit_index = min(max(int(bytes_value).bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes_value / (1 << (10 * unit_index)):.1f} {_BYTE_UNITS[unit_index]}"
+
+
+# Shared validator for validate_download_prerequisites; it holds no
+# per-call state
+_prerequisite_validator = FileSystemValidator()
 
 
 def validate_download_prerequisites(output_path: str, estimated_size: int = 0, 
@@ -384,7 +445,7 @@ def validate_download_prerequisites(output_path: str, estimated_size: int = 0,
     Raises:
         FileSystemError: If validation fails
     """
-    validator = FileSystemValidator()
+    validator = _prerequisite_validator
     
     results = {
         'path_safe': False,
@@ -346,12 +346,13 @@ class YouTubeDownloaderApp:
         Returns:
             Workflow type ('single', 'playlist', 'batch')
         """
-        # Check if it's a file path
-        if Path(input_value).exists() and Path(input_value).is_file():
+        # Check if it's a file path (is_file is False for missing paths)
+        if Path(input_value).is_file():
             return 'batch'
         
-        # Check if it's a playlist URL
-        if 'playlist' in input_value.lower() or 'list=' in input_value.lower():
+        # Check if it's a playlist URL, lowercasing only once
+        lowered = input_value.lower()
+        if 'list=' in lowered or 'playlist' in lowered:
             return 'playlist'
         
         # Default to single video
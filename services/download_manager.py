@@ -3,6 +3,7 @@ Download manager implementation using yt-dlp for video downloads.
 """
 
 import os
+import re
 import time
 import json
 from typing import List, Dict, Any, Callable, Optional
@@ -29,6 +30,10 @@ from services.subtitle_handler import SubtitleHandler
 from services.archive_manager import ArchiveManager
 
 
+# Playlist and channel markers; only the query-style markers ignore case
+_PLAYLIST_URL_RE = re.compile(r'(?i:playlist|list=)|/c/|/channel/|/user/')
+
+
 class TaskStatus(Enum):
     """Status enumeration for download tasks."""
     PENDING = "pending"
@@ -1128,7 +1133,7 @@ class DownloadManager(DownloadManagerInterface):
     
     def _is_playlist_url(self, url: str) -> bool:
         """Check if URL is a playlist URL."""
-        return 'playlist' in url.lower() or 'list=' in url.lower() or '/c/' in url or '/channel/' in url or '/user/' in url
+        return _PLAYLIST_URL_RE.search(url) is not None
     
     def _print_batch_summary(self, results: List[DownloadResult], single_count: int, playlist_count: int) -> None:
         """Print summary of batch download results."""
@@ -7,6 +7,7 @@ from typing import List, Optional, Callable
 from pathlib import Path
 import logging
 
+from cli.interfaces import YOUTUBE_URL_RE
 from models.core import DownloadConfig, DownloadResult, VideoMetadata
 from services.download_manager import DownloadManager
 from services.timestamp_parser import TimestampParser
@@ -14,6 +15,9 @@ from services.video_splitter import VideoSplitter
 
 logger = logging.getLogger(__name__)
 
+# Batch files up to this size are read whole instead of line by line
+_BATCH_READ_ALL_LIMIT = 16 * 1024 * 1024
+
 
 class WorkflowManager:
     """
@@ -336,31 +340,52 @@ class WorkflowManager:
             file_path: Path to batch file
             
         Returns:
-            List of valid URLs
+            List of valid URLs, in file order with duplicates removed
         """
         urls = []
+        seen = set()
+        invalid_lines = []
+        # Bound once for the per-line loop
+        append_url = urls.append
+        is_valid_url = self._is_valid_youtube_url
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
+            # A 1 MiB buffer reads typical batch files in a single call
+            with open(file_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+                # Small files are read and split in one go; larger ones are streamed
+                if os.fstat(f.fileno()).st_size <= _BATCH_READ_ALL_LIMIT:
+                    lines = f.read().split('\n')
+                else:
+                    lines = f
+                
+                for line_num, line in enumerate(lines, 1):
                     line = line.strip()
                     
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
+                    # Skip empty lines, comments and URLs listed earlier in the file
+                    if not line or line[0] == '#' or line in seen:
                         continue
+                    seen.add(line)
                     
                     # Basic URL validation
-                    if self._is_valid_youtube_url(line):
-                        urls.append(line)
+                    if is_valid_url(line):
+                        append_url(line)
                     else:
-                        logger.warning(f"Invalid URL on line {line_num}: {line}")
-                        print(f"Warning: Invalid URL on line {line_num}: {line}")
+                        invalid_lines.append((line_num, line))
                         
         except FileNotFoundError:
             raise FileNotFoundError(f"Batch file not found: {file_path}")
         except Exception as e:
             raise Exception(f"Failed to read batch file {file_path}: {str(e)}")
         
+        # Report invalid lines after the read loop, with a single print
+        if invalid_lines:
+            for line_num, line in invalid_lines:
+                logger.warning(f"Invalid URL on line {line_num}: {line}")
+            print('\n'.join(
+                f"Warning: Invalid URL on line {line_num}: {line}"
+                for line_num, line in invalid_lines
+            ))
+        
         return urls
     
     def _is_valid_youtube_url(self, url: str) -> bool:
@@ -373,16 +398,8 @@ class WorkflowManager:
         Returns:
             True if valid YouTube URL, False otherwise
         """
-        youtube_domains = [
-            'youtube.com', 'youtu.be', 'www.youtube.com', 'm.youtube.com'
-        ]
-        
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            return parsed.netloc.lower() in youtube_domains
-        except Exception:
-            return False
+        # Same pattern the CLI uses to validate and count batch file URLs
+        return isinstance(url, str) and YOUTUBE_URL_RE.match(url) is not None
     
     def create_batch_file_template(self, output_path: str) -> None:
         """
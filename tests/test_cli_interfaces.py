@@ -38,6 +38,17 @@ class TestArgumentValidator:
         for url in invalid_urls:
             assert not ArgumentValidator.validate_url(url), f"URL should be invalid: {url}"
     
+    def test_validate_url_rejects_lookalike_domains(self):
+        """Test that YouTube domains embedded elsewhere in a URL are rejected."""
+        lookalike_urls = [
+            'https://notyoutube.com.evil/watch?v=dQw4w9WgXcQ',
+            'https://evil.com/?next=youtube.com/watch',
+            'https://youtube.com.evil.net/watch?v=dQw4w9WgXcQ'
+        ]
+        
+        for url in lookalike_urls:
+            assert not ArgumentValidator.validate_url(url), f"URL should be invalid: {url}"
+    
     def test_validate_output_path_valid_paths(self):
         """Test validation of valid output paths."""
         valid_paths = [
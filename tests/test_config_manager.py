@@ -74,6 +74,82 @@ class TestConfigManager:
         assert config.format_preference == "webm"
         assert config.max_parallel_downloads == 5
     
+    def test_load_config_cached_until_file_changes(self):
+        """Test that repeated loads reuse the parsed config until the file changes."""
+        config_file = self.temp_path / "cached.json"
+        config_file.write_text(json.dumps({"quality": "720p"}))
+        
+        first = self.config_manager.load_config(config_file)
+        with patch('config.config_manager.json.load') as mock_load:
+            second = ConfigManager().load_config(config_file)
+        
+        mock_load.assert_not_called()
+        assert second.quality == "720p"
+        assert second is not first
+        
+        # Mutating a returned config must not leak into later loads
+        second.quality = "best"
+        second.subtitle_languages.append("fr")
+        third = self.config_manager.load_config(config_file)
+        assert third.quality == "720p"
+        assert third.subtitle_languages == ["en"]
+        
+        config_file.write_text(json.dumps({"quality": "1080p", "retry_attempts": 5}))
+        assert self.config_manager.load_config(config_file).quality == "1080p"
+    
+    def test_config_cache_replaces_entry_when_file_changes(self):
+        """Test that editing a config file replaces its cache entry instead of adding one."""
+        config_file = self.temp_path / "edited.json"
+        
+        for retry_attempts in range(1, 6):
+            # Padding changes the size, so the edit is seen even with coarse mtimes
+            config_file.write_text(json.dumps({"retry_attempts": retry_attempts}) + " " * retry_attempts)
+            loaded = self.config_manager.load_config(config_file)
+            assert loaded.retry_attempts == retry_attempts
+        
+        stat = config_file.stat()
+        file_entries = [key for key in ConfigManager._config_cache if key == (stat.st_dev, stat.st_ino)]
+        assert len(file_entries) == 1
+    
+    def test_load_config_after_save_skips_parsing(self):
+        """Test that a config saved by this process reloads without parsing."""
+        config_file = self.temp_path / "saved.json"
+        config = DownloadConfig(quality="480p", subtitle_languages=["en", "de"])
+        self.config_manager.save_config(config, config_file)
+        config.subtitle_languages.append("fr")
+        
+        with patch('config.config_manager.json.load') as mock_load:
+            loaded = self.config_manager.load_config(config_file)
+        
+        mock_load.assert_not_called()
+        assert loaded.quality == "480p"
+        assert loaded.subtitle_languages == ["en", "de"]
+    
+    def test_load_config_after_saving_invalid_config(self):
+        """Test that an invalid saved config fails to load in the saving process too."""
+        config_file = self.temp_path / "invalid_saved.json"
+        config = DownloadConfig(quality=720, output_directory=5)
+        self.config_manager.save_config(config, config_file)
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            self.config_manager.load_config(config_file)
+        
+        assert "output_directory must be a string" in str(exc_info.value)
+    
+    def test_save_config_does_not_log_value_warnings(self):
+        """Test that saving leaves unusual-value warnings to loading."""
+        config_file = self.temp_path / "warned.json"
+        config = DownloadConfig(format_preferences=FormatPreferences(video_codec='weird'))
+        
+        with patch.object(self.config_manager.logger, 'warning') as mock_warning:
+            self.config_manager.save_config(config, config_file)
+        mock_warning.assert_not_called()
+        
+        with patch.object(self.config_manager.logger, 'warning') as mock_warning:
+            ConfigManager._config_cache.clear()
+            self.config_manager.load_config(config_file)
+        mock_warning.assert_called_once_with("Unknown video codec: weird")
+    
     def test_load_config_invalid_json(self):
         """Test loading configuration from invalid JSON file."""
         config_file = self.temp_path / "invalid.json"
@@ -162,6 +238,28 @@ class TestConfigManager:
         assert merged_config.quality == 'best'  # Not overridden
         assert merged_config.max_parallel_downloads == 3  # Not overridden
     
+    def test_merge_cli_args_validates_overrides(self):
+        """Test merged configs are independent and invalid overrides are rejected."""
+        base_config = DownloadConfig()
+        
+        merged_config = self.config_manager.merge_cli_args(base_config, {'audio_codec': 'opus'})
+        merged_config.subtitle_languages.append('fr')
+        
+        assert merged_config.format_preferences.audio_codec == 'opus'
+        assert base_config.format_preferences.audio_codec == 'aac'
+        assert base_config.subtitle_languages == ['en']
+        
+        with pytest.raises(ValidationError):
+            self.config_manager.merge_cli_args(base_config, {'retries': -1})
+    
+    def test_merge_cli_args_keeps_string_subtitle_languages(self):
+        """Test a non-list subtitle_languages override is not split into characters."""
+        merged_config = self.config_manager.merge_cli_args(
+            DownloadConfig(), {'subtitle_languages': 'en'}
+        )
+        
+        assert merged_config.subtitle_languages == 'en'
+    
     def test_validate_config_valid(self):
         """Test configuration validation with valid config."""
         valid_config = {
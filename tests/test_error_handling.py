@@ -38,22 +38,22 @@ class TestErrorHandler:
         delay_1 = self.error_handler.get_retry_delay(1)
         delay_2 = self.error_handler.get_retry_delay(2)
         
-        # Should increase exponentially (with jitter)
-        assert 1.0 <= delay_0 <= 1.2  # 1.0 + 10% jitter
-        assert 2.0 <= delay_1 <= 2.4  # 2.0 + 10% jitter
-        assert 4.0 <= delay_2 <= 4.8  # 4.0 + 10% jitter
+        # Should increase exponentially (jittered within the upper half)
+        assert 0.5 <= delay_0 <= 1.0
+        assert 1.0 <= delay_1 <= 2.0
+        assert 2.0 <= delay_2 <= 4.0
     
     def test_get_retry_delay_max_cap(self):
         """Test that retry delay is capped at maximum."""
         # Test with high retry count
         delay = self.error_handler.get_retry_delay(10)
-        assert delay <= self.error_handler.max_delay * 1.1  # Max + jitter
+        assert self.error_handler.max_delay / 2 <= delay <= self.error_handler.max_delay
     
     def test_get_retry_delay_rate_limit_error(self):
         """Test retry delay for rate limit errors."""
         rate_limit_error = RateLimitError("Rate limited", retry_after=30)
         delay = self.error_handler.get_retry_delay(1, rate_limit_error)
-        assert delay == 30.0
+        assert 30.0 <= delay <= 33.0  # Never earlier than retry_after, up to 10% later
     
     def test_handle_network_error_retry(self):
         """Test network error retry logic."""
@@ -134,6 +134,30 @@ class TestErrorHandler:
         assert isinstance(classified, NetworkError)
         assert "network error" in str(classified).lower()
     
+    def test_classify_yt_dlp_error_caches_lowercase_message(self):
+        """Test the lowercased message is cached on the classified exception."""
+        mock_error = Mock(spec=Exception)
+        mock_error.__str__ = Mock(return_value="Connection TIMEOUT")
+        
+        first = self.error_handler.classify_yt_dlp_error(mock_error)
+        second = self.error_handler.classify_yt_dlp_error(mock_error)
+        
+        assert isinstance(first, NetworkError) and isinstance(second, NetworkError)
+        assert mock_error._lowercase_message == "connection timeout"
+    
+    def test_classify_yt_dlp_error_repeated_message(self):
+        """Test repeated messages yield fresh errors wrapping each original."""
+        first_error = Exception("Too many requests, retry after 30 seconds")
+        second_error = Exception("Too many requests, retry after 30 seconds")
+        
+        first = self.error_handler.classify_yt_dlp_error(first_error)
+        second = self.error_handler.classify_yt_dlp_error(second_error)
+        
+        assert first is not second
+        assert first.original_exception is first_error
+        assert second.original_exception is second_error
+        assert first.retry_after == second.retry_after == 30
+    
     def test_handle_graceful_degradation(self):
         """Test graceful degradation handling."""
         mock_error = Exception("Non-critical error")
@@ -176,12 +200,53 @@ class TestErrorHandler:
         
         # First occurrence
         self.error_handler.handle_error(error, context, 0)
-        assert f"{type(error).__name__}:{context}" in self.error_handler.error_counts
-        assert self.error_handler.error_counts[f"{type(error).__name__}:{context}"] == 1
+        assert (NetworkError, context) in self.error_handler.error_counts
+        assert self.error_handler.error_counts[(NetworkError, context)] == 1
         
         # Second occurrence
         self.error_handler.handle_error(error, context, 0)
-        assert self.error_handler.error_counts[f"{type(error).__name__}:{context}"] == 2
+        assert self.error_handler.error_counts[(NetworkError, context)] == 2
+    
+    def test_error_counts_bounded(self):
+        """Test error count tracking keeps the most frequent keys when over the cap."""
+        with patch('config.error_handling._MAX_ERROR_COUNT_KEYS', 4):
+            for _ in range(3):
+                self.error_handler.handle_error(NetworkError("Test error"), "frequent", 0)
+            for i in range(4):
+                self.error_handler.handle_error(NetworkError("Test error"), f"rare_{i}", 0)
+        
+        assert len(self.error_handler.error_counts) == 2
+        assert self.error_handler.error_counts[(NetworkError, "frequent")] == 3
+    
+    def test_repeated_error_logging_sampled(self):
+        """Test identical errors are logged once per sample interval."""
+        self.error_handler.handle_error(NetworkError("Connection reset"), "download", 0)
+        self.error_handler.handle_error(NetworkError("Connection reset"), "download", 1)
+        assert self.mock_logger.error.call_count == 1
+        
+        # A different message is logged immediately
+        self.error_handler.handle_error(NetworkError("DNS failure"), "download", 0)
+        assert self.mock_logger.error.call_count == 2
+        
+        # Once the interval has passed the repeated error is logged with the
+        # number of repeats suppressed in between
+        self.error_handler.log_sample_interval = 0
+        self.error_handler.handle_error(NetworkError("Connection reset"), "download", 2)
+        assert self.mock_logger.error.call_count == 3
+        extra = self.mock_logger.error.call_args.kwargs['extra']
+        assert extra['suppressed_repeats'] == 1
+        assert extra['error_count'] == 4
+    
+    def test_final_failure_always_logged(self):
+        """Test an error that will not be retried is logged within the sample interval."""
+        self.error_handler.handle_error(NetworkError("Connection reset"), "download", 0)
+        self.error_handler.handle_error(NetworkError("Connection reset"), "download", 1)
+        self.error_handler.handle_error(NetworkError("Connection reset"), "download", 3)
+        
+        assert self.mock_logger.error.call_count == 2
+        extra = self.mock_logger.error.call_args.kwargs['extra']
+        assert extra['retry_count'] == 3
+        assert extra['suppressed_repeats'] == 1
     
     def test_reset_error_counts(self):
         """Test resetting error counts."""
@@ -318,6 +383,20 @@ class TestErrorHandlingDecorator:
         
         with pytest.raises(GeoRestrictedError):
             yt_dlp_error_function()
+    
+    def test_decorator_chains_classified_error(self):
+        """Test a classified error is raised from the original exception."""
+        @with_error_handling(self.error_handler, "test_function", max_retries=1)
+        def yt_dlp_error_function():
+            error = Exception("Video not available in your country")
+            error.__module__ = "yt_dlp.utils"
+            raise error
+        
+        with pytest.raises(GeoRestrictedError) as exc_info:
+            yt_dlp_error_function()
+        
+        assert exc_info.value.__cause__ is exc_info.value.original_exception
+        assert self.error_handler.error_counts[(GeoRestrictedError, "test_function")] == 1
 
 
 class TestErrorRecovery:
@@ -159,6 +159,32 @@ class TestFileSystemValidator:
         assert usage_info['free_bytes'] >= 0
         assert 0 <= usage_info['usage_percent'] <= 100
     
+    def test_disk_usage_cached_between_checks(self):
+        """Test back-to-back disk checks share one disk_usage call until it expires."""
+        FileSystemValidator._disk_usage_cache.clear()
+        real_disk_usage = shutil.disk_usage
+        
+        with patch('config.filesystem_validator.shutil.disk_usage', side_effect=real_disk_usage) as mock_usage:
+            self.validator.validate_disk_space(str(self.temp_path), 1024)
+            self.validator.get_disk_usage_info(str(self.temp_path))
+            assert mock_usage.call_count == 1
+            
+            with patch('config.filesystem_validator._DISK_USAGE_CACHE_TTL', 0):
+                self.validator.get_disk_usage_info(str(self.temp_path))
+            assert mock_usage.call_count == 2
+    
+    def test_disk_usage_cache_bounded(self):
+        """Test the disk usage cache is emptied instead of growing past its limit."""
+        FileSystemValidator._disk_usage_cache.clear()
+        
+        with patch('config.filesystem_validator._MAX_DISK_USAGE_CACHE_ENTRIES', 2):
+            for name in ('a', 'b', 'c'):
+                directory = self.temp_path / name
+                directory.mkdir()
+                self.validator.get_disk_usage_info(str(directory))
+        
+        assert len(FileSystemValidator._disk_usage_cache) == 1
+    
     def test_estimate_video_size_video_formats(self):
         """Test video size estimation for different video qualities."""
         duration = 3600  # 1 hour
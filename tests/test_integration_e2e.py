@@ -338,6 +338,32 @@ https://www.youtube.com/playlist?list=test_playlist_1
         assert 'BASIC DOWNLOADS:' in result.output
         assert 'ADVANCED FEATURES:' in result.output
     
+    @patch('config.setup_logging')
+    def test_cli_subcommand_help_skips_setup(self, mock_setup_logging):
+        """Test subcommand help does not configure logging or load config."""
+        result = self.runner.invoke(main, ['download', '--help'])
+        assert result.exit_code == 0
+        mock_setup_logging.assert_not_called()
+        
+        # A real command still runs the setup
+        result = self.runner.invoke(main, ['validate-config', '--config', str(self.test_config_path)])
+        assert result.exit_code == 0
+        assert 'Configuration file is valid' in result.output
+        assert 'Configuration Summary:' in result.output
+        mock_setup_logging.assert_called_once()
+    
+    def test_cli_progress_frame_ends_with_carriage_return(self, capsys):
+        """Test progress frames return the cursor for the next line."""
+        from cli.main_cli import YouTubeDownloaderCLI
+        
+        cli_app = YouTubeDownloaderCLI()
+        cli_app.display_progress(ProgressInfo(
+            current_file="video.mp4", progress_percent=100.0, download_speed="1.0MB/s",
+            eta="00:00", files_completed=1, total_files=1
+        ))
+        
+        assert capsys.readouterr().out == "video.mp4: 100.0% (1.0MB/s) ETA: 00:00\r"
+    
     def test_cli_invalid_url_handling(self):
         """Test CLI handling of invalid URLs."""
         # Test invalid URL
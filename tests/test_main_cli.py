@@ -0,0 +1,133 @@
+"""
+Unit tests for the batch file helpers shared by the CLI commands.
+"""
+
+import pytest
+import tempfile
+import time
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+from cli.commands._shared import iter_batch_file, count_batch_urls, _MAX_BATCH_FILE_SIZE
+from config.error_handling import ConfigurationError
+
+
+class TestBatchFileReading:
+    """Test cases for reading URLs from batch files."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _write_batch_file(self, name, lines):
+        """Write lines to a batch file and return its path."""
+        batch_file = self.temp_path / name
+        batch_file.write_text('\n'.join(lines), encoding='utf-8')
+        return batch_file
+    
+    def test_fast_and_slow_paths_yield_same_urls(self, capsys):
+        """Test the regex sweep and the per-line loop agree on valid lines."""
+        valid_lines = [
+            '# Videos to download',
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            '',
+            '   https://youtu.be/abc123def45   ',
+            '\thttps://m.youtube.com/watch?v=xyz789ghi01',
+            '  # indented comment',
+            'https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLMHjMZOz59Oq3KuQEl'
+        ]
+        fast_file = self._write_batch_file('fast.txt', valid_lines)
+        slow_file = self._write_batch_file('slow.txt', valid_lines + ['not_a_url'])
+        
+        fast_urls = list(iter_batch_file(fast_file))
+        slow_urls = list(iter_batch_file(slow_file))
+        
+        assert fast_urls == slow_urls == [
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://youtu.be/abc123def45',
+            'https://m.youtube.com/watch?v=xyz789ghi01',
+            'https://www.youtube.com/playlist?list=PLrAXtmRdnEQy6nuLMHjMZOz59Oq3KuQEl'
+        ]
+        # Only the slow path has anything to report
+        assert capsys.readouterr().err == "Warning: Invalid URL on line 8: not_a_url\n"
+    
+    def test_invalid_lines_reported_with_line_numbers(self, capsys):
+        """Test each invalid line is reported on stderr with its line number."""
+        batch_file = self._write_batch_file('invalid.txt', [
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://www.google.com/search',
+            '',
+            '# comment',
+            '  not_a_url  '
+        ])
+        
+        urls = list(iter_batch_file(batch_file))
+        
+        assert urls == ['https://www.youtube.com/watch?v=dQw4w9WgXcQ']
+        assert capsys.readouterr().err == (
+            "Warning: Invalid URL on line 2: https://www.google.com/search\n"
+            "Warning: Invalid URL on line 5: not_a_url\n"
+        )
+    
+    def test_duplicate_urls_removed(self):
+        """Test repeated URLs are yielded once on both paths."""
+        lines = [
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://youtu.be/abc123def45',
+            '  https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+        ]
+        expected = ['https://www.youtube.com/watch?v=dQw4w9WgXcQ', 'https://youtu.be/abc123def45']
+        
+        assert list(iter_batch_file(self._write_batch_file('fast.txt', lines))) == expected
+        assert list(iter_batch_file(self._write_batch_file('slow.txt', lines + ['bad']))) == expected
+    
+    def test_long_whitespace_run_scanned_in_linear_time(self):
+        """Test whitespace inside a line does not make the regex sweep backtrack."""
+        url_with_gap = 'https://youtube.com/watch?v=a' + ' ' * 200000 + 'x'
+        batch_file = self._write_batch_file('gap.txt', [
+            url_with_gap,
+            'https://youtu.be/abc123def45' + ' ' * 200000
+        ])
+        
+        start_time = time.perf_counter()
+        urls = list(iter_batch_file(batch_file))
+        elapsed = time.perf_counter() - start_time
+        
+        assert urls == [url_with_gap, 'https://youtu.be/abc123def45']
+        assert elapsed < 2.0
+    
+    def test_count_batch_urls(self):
+        """Test counting distinct valid URLs in a batch file."""
+        batch_file = self._write_batch_file('count.txt', [
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+            'https://youtu.be/abc123def45',
+            '# comment'
+        ])
+        
+        assert count_batch_urls(batch_file) == 2
+    
+    def test_count_batch_urls_rejects_oversized_file(self):
+        """Test batch files over the size limit are rejected before reading."""
+        batch_file = self._write_batch_file('huge.txt', ['https://youtu.be/abc123def45'])
+        
+        with patch('cli.commands._shared.os.path.getsize', return_value=_MAX_BATCH_FILE_SIZE + 1), \
+                patch('cli.commands._shared.iter_batch_file') as mock_iter:
+            with pytest.raises(ConfigurationError) as exc_info:
+                count_batch_urls(batch_file)
+        
+        assert "too large" in str(exc_info.value)
+        mock_iter.assert_not_called()
+    
+    def test_count_batch_urls_missing_file(self):
+        """Test a missing batch file raises ConfigurationError."""
+        with pytest.raises(ConfigurationError) as exc_info:
+            count_batch_urls(self.temp_path / 'missing.txt')
+        
+        assert "Failed to read batch file" in str(exc_info.value)
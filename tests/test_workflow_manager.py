@@ -466,6 +466,36 @@ https://youtube.com/playlist?list=playlist1
         
         assert len(urls) == 0
     
+    def test_read_batch_file_removes_duplicates(self):
+        """Test that duplicate URLs in a batch file are only returned once."""
+        batch_file = self.temp_path / 'duplicate_batch.txt'
+        batch_file.write_text(
+            'https://youtube.com/watch?v=video1\n'
+            'https://youtu.be/video2\n'
+            'https://youtube.com/watch?v=video1\n'
+            '  https://youtu.be/video2  \n'
+        )
+        
+        urls = self.workflow_manager._read_batch_file(str(batch_file))
+        
+        assert urls == ['https://youtube.com/watch?v=video1', 'https://youtu.be/video2']
+    
+    def test_read_batch_file_streams_large_files(self):
+        """Test that files over the read-all limit give the same URLs when streamed."""
+        batch_file = self.temp_path / 'streamed_batch.txt'
+        batch_file.write_text(
+            '# Comment\n'
+            'https://youtube.com/watch?v=video1\n'
+            'not_a_url\n'
+            'https://youtu.be/video2\n'
+        )
+        
+        whole = self.workflow_manager._read_batch_file(str(batch_file))
+        with patch('services.workflow_manager._BATCH_READ_ALL_LIMIT', 0):
+            streamed = self.workflow_manager._read_batch_file(str(batch_file))
+        
+        assert streamed == whole == ['https://youtube.com/watch?v=video1', 'https://youtu.be/video2']
+    
     def test_read_batch_file_not_found(self):
         """Test reading non-existent batch file."""
         with pytest.raises(FileNotFoundError):
@@ -479,7 +509,9 @@ https://youtube.com/playlist?list=playlist1
             ('https://youtu.be/test123', True),
             ('https://m.youtube.com/watch?v=test123', True),
             ('https://youtube.com/playlist?list=test123', True),
+            ('https://music.youtube.com/watch?v=test123', True),
             ('https://example.com/video', False),
+            ('https://youtube.com.example.com/video', False),
             ('not_a_url', False),
             ('', False),
         ]